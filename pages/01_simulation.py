@@ -3,7 +3,10 @@ from math import pi
 import numpy as np
 import datetime
 import json
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytz
 import logging
 import time
@@ -67,11 +70,12 @@ def load_json_file(filename):
         if 'rockets.json' in filename:
             rockets = {}
             configs_path = 'data/rockets/configs/'
-            for file in os.listdir(configs_path):
-                if file.endswith('.json'):
-                    with open(os.path.join(configs_path, file), 'r', encoding='utf-8') as f:
-                        rocket_data = json.load(f)
-                        rockets[rocket_data["name"]] = rocket_data
+            with os.scandir(configs_path) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.json') and entry.is_file():
+                        with open(entry.path, 'rb') as f:
+                            rocket_data = orjson.loads(f.read())
+                            rockets[rocket_data["name"]] = rocket_data
             return rockets
         elif 'locations.json' in filename:
             with open('data/locations/launch_sites.json', 'r', encoding='utf-8') as file:
@@ -168,6 +172,16 @@ def prepare_data_for_storage(data):
         # Convert other types to string representation
         return str(data)
 
+# Series que grafica el dashboard, guardadas también submuestreadas en un parquet aparte
+DASHBOARD_DOWNSAMPLE = 50
+DASHBOARD_CHART_COLUMNS = [
+    "Simulation time", "Range", "Up coordinate", "Velocity norm", "Mach number", "Angle of attack",
+    "Thrust", "Lift force in bodyframe", "Drag force in bodyframe", "Mass of the rocket",
+    "Pitch Angle", "Roll Angle", "Yaw Angle", "v_bx", "v_by", "v_bz",
+    "Density of the atmosphere", "Ambient pressure", "Drag coefficient", "Lift coefficient",
+    "Latitude", "Longitude", "Altitude",
+]
+
 def save_simulation_data(sim_params, Sistema, min_length):
     """Save simulation data to parquet file for dashboard with enhanced location data"""
     try:
@@ -189,6 +203,12 @@ def save_simulation_data(sim_params, Sistema, min_length):
             "description": location_data.get('description', '')
         }
         
+        # Vectores (N, 3) que el dashboard consume por componente: se guardan
+        # como columnas float32 independientes en lugar de listas por fila
+        accel_b = np.asarray(Sistema.hist_accel_b[:min_length], dtype=np.float32).reshape(-1, 3)
+        cm_b = np.asarray(Sistema.hist_cm_b[:min_length], dtype=np.float32).reshape(-1, 3)
+        cp_b = np.asarray(Sistema.hist_cp_b[:min_length], dtype=np.float32).reshape(-1, 3)
+        
         # Create data dictionary in the exact format expected by dashboard
         df_data = {
             "Rocket name": [sim_rocket] * min_length,
@@ -214,8 +234,6 @@ def save_simulation_data(sim_params, Sistema, min_length):
             "Latitude": prepare_data_for_storage(np.array(Sistema.hist_lat[:min_length])),
             "Longitude": prepare_data_for_storage(np.array(Sistema.hist_long[:min_length])),
             "Altitude": prepare_data_for_storage(np.array(Sistema.hist_alt[:min_length])),
-            "East-North-Up location from platform": prepare_data_for_storage(Sistema.hist_r_enu[:min_length]),
-            "East-North-Up velocity from platform": prepare_data_for_storage(Sistema.hist_v_enu[:min_length]),
             "Pitch Angle": prepare_data_for_storage(np.array(Sistema.hist_pitch[:min_length])),
             "Yaw Angle": prepare_data_for_storage(np.array(Sistema.hist_yaw[:min_length])),
             "Roll Angle": prepare_data_for_storage(np.array(Sistema.hist_roll[:min_length])),
@@ -223,7 +241,6 @@ def save_simulation_data(sim_params, Sistema, min_length):
             "v_bx": prepare_data_for_storage(np.array(Sistema.hist_v_bx[:min_length])),
             "v_by": prepare_data_for_storage(np.array(Sistema.hist_v_by[:min_length])),
             "v_bz": prepare_data_for_storage(np.array(Sistema.hist_v_bz[:min_length])),
-            "Rotational velocity in East-North-Up": prepare_data_for_storage(np.array(Sistema.hist_w_enu[:min_length])),
             
             # Atmosphere
             "Density of the atmosphere": prepare_data_for_storage(np.array(Sistema.hist_density[:min_length])),
@@ -236,18 +253,18 @@ def save_simulation_data(sim_params, Sistema, min_length):
             "Drag coefficient": prepare_data_for_storage(np.array(Sistema.hist_drag_coeff[:min_length])),
             "Lift coefficient": prepare_data_for_storage(np.array(Sistema.hist_lift_coeff[:min_length])),
             "Thrust": prepare_data_for_storage(np.array(Sistema.hist_thrust[:min_length])),
-            "Inertia matrix in bodyframe": prepare_data_for_storage(np.array(Sistema.hist_inertia_b[:min_length])),
-            "Center of mass in bodyframe": prepare_data_for_storage(np.array(Sistema.hist_cm_b[:min_length])),
-            "Center of pressure in bodyframe": prepare_data_for_storage(np.array(Sistema.hist_cp_b[:min_length])),
+            "cm_bx": cm_b[:, 0],
+            "cm_by": cm_b[:, 1],
+            "cm_bz": cm_b[:, 2],
+            "cp_bx": cp_b[:, 0],
+            "cp_by": cp_b[:, 1],
+            "cp_bz": cp_b[:, 2],
             "Mass flux": prepare_data_for_storage(np.array(Sistema.hist_mass_flux[:min_length])),
             "Drag force in bodyframe": prepare_data_for_storage(np.array(Sistema.hist_drag[:min_length])),
             "Lift force in bodyframe": prepare_data_for_storage(np.array(Sistema.hist_lift[:min_length])),
-            "Center of mass to center of pressure in bodyframe": prepare_data_for_storage(np.array(Sistema.hist_cm2cp_b[:min_length])),
-            "Aerodynamic forces in bodyframe": prepare_data_for_storage(np.array(Sistema.hist_forces_aero_b[:min_length])),
-            "Aerodynamic torques in bodyframe": prepare_data_for_storage(np.array(Sistema.hist_torques_aero_b[:min_length])),
-            "Engine forces in bodyframe": prepare_data_for_storage(np.array(Sistema.hist_forces_engine_b[:min_length])),
-            "Engine torques in bodyframe": prepare_data_for_storage(np.array(Sistema.hist_torques_engine_b[:min_length])),
-            "Acceleration in bodyframe": prepare_data_for_storage(np.array(Sistema.hist_accel_b[:min_length])),
+            "a_bx": accel_b[:, 0],
+            "a_by": accel_b[:, 1],
+            "a_bz": accel_b[:, 2],
             
             # Separate quaternion components into individual columns
             "Quaternion_1": prepare_data_for_storage(np.array(Sistema.hist_q_enu2b_1[:min_length])),
@@ -259,11 +276,36 @@ def save_simulation_data(sim_params, Sistema, min_length):
         # Create DataFrame
         simulation_df = pd.DataFrame(df_data)
         
+        # Resto de vectores (N, 3): columnas Arrow FixedSizeList<float32, 3>, un único buffer
+        # contiguo que se lee como ndarray (N, 3) sin reconstruir listas por fila
+        vector_data = {
+            "East-North-Up location from platform": Sistema.hist_r_enu,
+            "East-North-Up velocity from platform": Sistema.hist_v_enu,
+            "Rotational velocity in East-North-Up": Sistema.hist_w_enu,
+            "Inertia matrix in bodyframe": Sistema.hist_inertia_b,
+            "Center of mass to center of pressure in bodyframe": Sistema.hist_cm2cp_b,
+            "Aerodynamic forces in bodyframe": Sistema.hist_forces_aero_b,
+            "Aerodynamic torques in bodyframe": Sistema.hist_torques_aero_b,
+            "Engine forces in bodyframe": Sistema.hist_forces_engine_b,
+            "Engine torques in bodyframe": Sistema.hist_torques_engine_b,
+        }
+        simulation_table = pa.Table.from_pandas(simulation_df, preserve_index=False)
+        for name, history in vector_data.items():
+            values = pa.array(np.asarray(history[:min_length], dtype=np.float32).reshape(-1))
+            simulation_table = simulation_table.append_column(name, pa.FixedSizeListArray.from_arrays(values, 3))
+        
         # Ensure directory exists
         os.makedirs('data/simulation', exist_ok=True)
         
         # Save to parquet
-        simulation_df.to_parquet('data/simulation/sim_data.parquet', index=False)
+        pq.write_table(simulation_table, 'data/simulation/sim_data.parquet')
+        
+        # Trayectoria submuestreada una sola vez para los gráficos y mapas del dashboard;
+        # float32 basta para graficar, salvo lat/lon que alimentan el mapa
+        chart_df = simulation_df[DASHBOARD_CHART_COLUMNS].iloc[::DASHBOARD_DOWNSAMPLE]
+        chart_df = chart_df.astype({column: np.float32 for column in DASHBOARD_CHART_COLUMNS
+                                    if column not in ("Latitude", "Longitude")})
+        chart_df.to_parquet('data/simulation/sim_data_downsampled.parquet', index=False, compression='zstd')
         
         logger.info(f"Simulation data saved to parquet file with {min_length} data points")
         return True
@@ -1,6 +1,7 @@
 #create and edit rockets properties for the simulator
 import streamlit as st
 import json
+import orjson
 import numpy as np
 import pyvista as pv # type: ignore
 from stpyvista import stpyvista # type: ignore
@@ -10,19 +11,30 @@ import tempfile
 import matplotlib.pyplot as plt
 
 
+def config_files_signature(configs_path):
+    """Nombre y fecha de modificación de cada JSON del directorio; cambia si algún archivo cambia"""
+    return tuple(sorted(
+        (entry.name, entry.stat().st_mtime_ns)
+        for entry in os.scandir(configs_path)
+        if entry.name.endswith('.json')
+    ))
+
+@st.cache_data(show_spinner=False)
+def read_rocket_configs(configs_path, signature):
+    """Lee los JSON de cohetes; solo se vuelve a ejecutar cuando cambia la firma del directorio"""
+    rockets = {}
+    for filename, _ in signature:
+        with open(os.path.join(configs_path, filename), 'rb') as f:
+            rocket_data = orjson.loads(f.read())
+            rockets[rocket_data["name"]] = rocket_data
+    return rockets
+
 def load_rocket_configs():
     """Carga todas las configuraciones de cohetes desde la nueva estructura"""
-    rockets = {}
     configs_path = 'data/rockets/configs'
     
     try:
-        for filename in os.listdir(configs_path):
-            if filename.endswith('.json'):
-                file_path = os.path.join(configs_path, filename)
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    rocket_data = json.load(f)
-                    rockets[rocket_data["name"]] = rocket_data
-        return rockets
+        return read_rocket_configs(configs_path, config_files_signature(configs_path))
     except FileNotFoundError:
         st.error(f"No se encontró el directorio {configs_path}")
         return {}
@@ -30,6 +42,12 @@ def load_rocket_configs():
         st.error(f"Error cargando configuraciones: {str(e)}")
         return {}
 
+SAFE_NAME_TABLE = str.maketrans({" ": "_"})
+
+def safe_config_name(name):
+    """Nombre de archivo de una configuración: minúsculas y espacios como '_'"""
+    return name.translate(SAFE_NAME_TABLE).lower()
+
 def save_rocket_config(rocket_data):
     """Guarda la configuración de un cohete en un archivo individual"""
     configs_path = 'data/rockets/configs'
@@ -39,12 +57,13 @@ def save_rocket_config(rocket_data):
         os.makedirs(configs_path, exist_ok=True)
         
         # Generar nombre de archivo seguro
-        safe_name = rocket_data["name"].lower().replace(" ", "_")
+        safe_name = safe_config_name(rocket_data["name"])
         file_path = os.path.join(configs_path, f"{safe_name}.json")
         
         # Guardar archivo
         with open(file_path, 'w', encoding='utf-8') as f:
             json.dump(rocket_data, f, indent=4, ensure_ascii=False)
+        read_rocket_configs.clear()
             
         return True, f"Cohete guardado en {file_path}"
     except Exception as e:
@@ -53,12 +72,13 @@ def save_rocket_config(rocket_data):
 def delete_rocket_config(rocket_name):
     """Elimina la configuración de un cohete"""
     configs_path = 'data/rockets/configs'
-    safe_name = rocket_name.lower().replace(" ", "_")
+    safe_name = safe_config_name(rocket_name)
     file_path = os.path.join(configs_path, f"{safe_name}.json")
     
     try:
         if os.path.exists(file_path):
             os.remove(file_path)
+            read_rocket_configs.clear()
             return True, f"Cohete {rocket_name} eliminado"
         return False, "Archivo no encontrado"
     except Exception as e:
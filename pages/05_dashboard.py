@@ -1,83 +1,378 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
+import pyarrow.parquet as pq
 from streamlit_keplergl import keplergl_static
 from keplergl import KeplerGl
 import matplotlib.pyplot as plt
-import json
+import orjson
 from reportlab.lib.pagesizes import letter, A4 # type: ignore
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer # type: ignore
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle # type: ignore
 from reportlab.lib.units import inch # type: ignore
 from reportlab.lib import colors # type: ignore
 from reportlab.platypus import Image # type: ignore
+import copy
+from collections import namedtuple
+import functools
 import io
+import os
 import base64
 from math import cos, pi
+from src.utils.geotools import GeoTools as Geo
+from src.utils.stability import stability_metrics, summarize_stability, add_stability_columns
 
 # Configuración de la página
 st.set_page_config(page_title="Rocket Simulator Dashboard", page_icon=":rocket:", layout="wide")
 st.title("Rocket Simulator Dashboard")
 
+# Columnas vectoriales antiguas (listas por fila) y el prefijo de sus componentes
+LEGACY_VECTOR_COLUMNS = {
+    "Acceleration in bodyframe": "a_b",
+    "Center of mass in bodyframe": "cm_b",
+    "Center of pressure in bodyframe": "cp_b",
+}
+ACCEL_COLS = ["a_bx", "a_by", "a_bz"]
+CM_COLS = ["cm_bx", "cm_by", "cm_bz"]
+CP_COLS = ["cp_bx", "cp_by", "cp_bz"]
+
+SIM_DATA_PATH = "data/simulation/sim_data.parquet"
+SIM_DOWNSAMPLED_PATH = "data/simulation/sim_data_downsampled.parquet"
+GEO_COLUMNS = ("Latitude", "Longitude", "Location Latitude", "Location Longitude")
+BOUNDS_COLUMNS = ["Range", "East coordinate", "North coordinate", "Up coordinate"]
+TRAJECTORY_TOLERANCE = 5.0  # Tolerancia de simplificación de la trayectoria en el mapa [m]
+# Columnas que usa el dashboard; el resto del parquet no se decodifica
+USED_COLUMNS = [
+    "Rocket name", "Location name", "Location Latitude", "Location Longitude",
+    "Simulation time", "Range", "East coordinate", "North coordinate", "Up coordinate",
+    "Velocity norm", "Latitude", "Longitude", "Altitude",
+    "Pitch Angle", "Roll Angle", "Yaw Angle", "Angle of attack", "v_bx", "v_by", "v_bz",
+    "Density of the atmosphere", "Ambient pressure", "Speed of sound", "Mach number",
+    "Mass of the rocket", "Thrust", "Drag coefficient", "Lift coefficient",
+    "Drag force in bodyframe", "Lift force in bodyframe",
+    *ACCEL_COLS, *CM_COLS, *CP_COLS, *LEGACY_VECTOR_COLUMNS,
+]
+
+# Configuración estática de los mapas KeplerGl; solo el centro cambia entre simulaciones
+TRAJECTORY_MAP_CONFIG = {
+    "version": "v1",
+    "config": {
+        "mapState": {
+            "bearing": 0,
+            "pitch": 60,
+            "zoom": 9,
+        }
+    }
+}
+RISK_MAP_CONFIG = {
+    "version": "v1",
+    "config": {
+        "mapState": {
+            "bearing": 0,
+            "pitch": 45,
+            "zoom": 12,
+        },
+        "visState": {
+            "layers": [
+                {
+                    "type": "geojson",
+                    "config": {
+                        "dataId": "risk_layer",
+                        "visible": True,
+                        "opacity": 0.8
+                    }
+                }
+            ]
+        }
+    }
+}
+
+# Disposición de las métricas principales: filas de (clave, etiqueta, unidad)
+METRIC_LAYOUT = (
+    (('total_time', "Total Flight Time", "s"), ('max_range', "Max Range", "km"), ('max_alt', "Max Altitude", "km")),
+    (('initial_mass', "Initial Mass", "kg"), ('final_mass', "Final Mass", "kg"), ('propellant_used', "Propellant Used", "kg")),
+    (('max_speed', "Max Speed", "m/s"), ('max_mach', "Max Mach", ""), ('max_accel_g', "Max G-Force", "G")),
+)
+
+# Estilos del reporte PDF: se construyen una sola vez al cargar la página
+PDF_STYLES = getSampleStyleSheet()
+PDF_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=PDF_STYLES['Heading1'],
+    fontSize=18,
+    spaceAfter=30,
+    alignment=1
+)
+OVERVIEW_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+])
+STABILITY_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.lightblue),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+])
+
 # Funciones auxiliares
-@st.cache_data
+LaunchInfo = namedtuple("LaunchInfo", ["rocket", "location", "latitude", "longitude"])
+
+def launch_info(data):
+    """Datos constantes del lanzamiento, leídos una sola vez de la primera fila"""
+    return LaunchInfo(
+        rocket=data['Rocket name'].iat[0],
+        location=data['Location name'].iat[0],
+        latitude=float(data['Location Latitude'].iat[0]),
+        longitude=float(data['Location Longitude'].iat[0])
+    )
+
+def centered_map_config(template, latitude, longitude):
+    """Copia de una configuración de mapa centrada en (latitude, longitude)"""
+    config = copy.deepcopy(template)
+    config["config"]["mapState"].update(latitude=float(latitude), longitude=float(longitude))
+    return config
+
+def expand_vector_columns(data, dtype=np.float32):
+    """Convierte columnas de listas [x, y, z] de simulaciones antiguas en tres columnas `dtype`"""
+    for column, prefix in LEGACY_VECTOR_COLUMNS.items():
+        if column not in data.columns or f"{prefix}x" in data.columns:
+            continue
+        vectors = np.vstack(data[column].to_numpy()).astype(dtype) if len(data) else np.empty((0, 3), dtype)
+        for i, axis in enumerate("xyz"):
+            data[f"{prefix}{axis}"] = vectors[:, i]
+        data = data.drop(columns=column)
+    return data
+
+@st.cache_resource(max_entries=1)
+def read_simulation_file(mtime):
+    """Lee el parquet una sola vez por proceso; `mtime` invalida la caché tras una nueva simulación.
+
+    El DataFrame se comparte entre sesiones sin copiarlo, por lo que no debe modificarse in-place.
+    """
+    # Proyección de columnas: solo se leen del schema las que existen en el archivo
+    available = set(pq.read_schema(SIM_DATA_PATH).names)
+    columns = [column for column in USED_COLUMNS if column in available]
+    data = expand_vector_columns(pd.read_parquet(SIM_DATA_PATH, columns=columns, engine="pyarrow"))
+    # float32 basta para métricas y gráficos; las coordenadas geográficas conservan float64
+    return data.astype({column: np.float32 for column in data.select_dtypes("float64").columns
+                        if column not in GEO_COLUMNS})
+
 def load_simulation_data():
     """Carga y valida los datos de la simulación"""
     try:
-        data = pd.read_parquet("data/simulation/sim_data.parquet")
-        return data
+        return read_simulation_file(os.path.getmtime(SIM_DATA_PATH))
     except Exception as e:
         st.error(f"Error cargando datos: {str(e)}")
         return pd.DataFrame()
 
-@st.cache_data
 def compress_data(data, compression_factor=50):
-    """Comprime los datos para visualización"""
-    return data.iloc[::compression_factor].copy()
+    """Comprime los datos para visualización (vista con paso, solo lectura).
+
+    Sin caché: el corte con paso es más barato que hashear y serializar el DataFrame.
+    """
+    return data.iloc[::compression_factor]
+
+@st.cache_resource(max_entries=1)
+def read_downsampled_file(mtime):
+    """Lee la trayectoria submuestreada que escribe la página de simulación"""
+    return pd.read_parquet(SIM_DOWNSAMPLED_PATH, engine="pyarrow")
+
+def load_chart_data(data):
+    """Datos para gráficos y mapas: el parquet submuestreado si está al día, si no `compress_data`"""
+    try:
+        mtime = os.path.getmtime(SIM_DOWNSAMPLED_PATH)
+        if mtime >= os.path.getmtime(SIM_DATA_PATH):
+            return read_downsampled_file(mtime)
+    except OSError:
+        pass
+    chart_data = compress_data(data)
+    return chart_data.astype({column: np.float32 for column in chart_data.select_dtypes("float64").columns
+                              if column not in GEO_COLUMNS})
+
+@st.cache_data
+def trajectory_coordinates(longitude, latitude, altitude, tolerance=TRAJECTORY_TOLERANCE):
+    """Vértices [lon, lat, alt] de la trayectoria simplificada con RDP (tolerancia en metros)"""
+    # Coordenadas locales en metros para que la tolerancia sea homogénea en los tres ejes
+    local = np.column_stack((
+        (longitude - longitude[0]) * 111320.0 * cos(latitude[0] * pi / 180),
+        (latitude - latitude[0]) * 111320.0,
+        altitude
+    ))
+    keep = Geo.simplify_path(local, tolerance)
+    return np.column_stack((longitude[keep], latitude[keep], altitude[keep])).tolist()
+
+@functools.lru_cache(maxsize=32)
+def create_safety_box(center_lat, center_lon, width_km, length_km):
+    """Crea un polígono rectangular para el área segura (tuplas: el resultado cacheado es inmutable)"""
+    lat_delta = (width_km / 2) / 111.32  # 1 grado ≈ 111.32 km
+    lon_delta = (length_km / 2) / (111.32 * cos(center_lat * pi / 180))
+    
+    return (
+        (center_lon - lon_delta, center_lat - lat_delta),
+        (center_lon + lon_delta, center_lat - lat_delta),
+        (center_lon + lon_delta, center_lat + lat_delta),
+        (center_lon - lon_delta, center_lat + lat_delta),
+        (center_lon - lon_delta, center_lat - lat_delta)
+    )
+
+def markdown_table(rows, header=("Parameter", "Value")):
+    """Tabla markdown a partir de filas ya formateadas"""
+    lines = [f"| {' | '.join(header)} |", f"|{'---|' * len(header)}"]
+    lines += [f"| {' | '.join(row)} |" for row in rows]
+    return "\n".join(lines)
+
+def to_json(obj):
+    """Serializa a str JSON aceptando escalares y arrays de numpy"""
+    return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+@st.cache_data(max_entries=4)
+def risk_geojson_json(longitude, latitude, safety_area):
+    """GeoJSON serializado del mapa de riesgo: trayectoria y área de seguridad"""
+    return to_json({
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "geometry": {
+                    "type": "LineString",
+                    "coordinates": np.column_stack((longitude, latitude)).tolist()
+                },
+                "properties": {
+                    "name": "Flight Path",
+                    "color": [255, 0, 0]
+                }
+            },
+            {
+                "type": "Feature",
+                "geometry": {
+                    "type": "Polygon",
+                    "coordinates": [safety_area]
+                },
+                "properties": {
+                    "name": "Safety Area",
+                    "color": [0, 255, 0, 80]
+                }
+            }
+        ]
+    })
+
+@st.cache_resource(max_entries=4)
+def build_kepler_map(data_id, geojson, config, height=400):
+    """Instancia KeplerGl reutilizable entre reruns; datos y config llegan serializados (hash barato)"""
+    kepler_map = KeplerGl(height=height)
+    kepler_map.add_data(data=geojson, name=data_id)
+    kepler_map.config = orjson.loads(config)
+    return kepler_map
+
+@st.cache_data
+def atmospheric_profile(up, density, pressure):
+    """Densidad y presión normalizadas por su máximo frente a la altura"""
+    return pd.DataFrame({
+        "Up coordinate": up,
+        "Normalized Density": density / density.max(),
+        "Normalized Pressure": pressure / pressure.max()
+    }, copy=False)
+
+@st.cache_data(max_entries=1)
+def build_stability(_chart_data, data_version):
+    """Métricas de estabilidad CM/CP por muestra (vectorizado sobre todas las filas).
+
+    `_chart_data` no se hashea; la clave de caché es `data_version` (mtime del parquet).
+    """
+    stability_df = stability_metrics(_chart_data, CM_COLS, CP_COLS)
+    stats = summarize_stability(stability_df['stability_calibers'].to_numpy(), stability_df['status'].to_numpy())
+    return stability_df, compress_data(stability_df), stats
 
 @st.cache_data
 def calculate_metrics(data):
     """Calcula métricas principales de la simulación"""
     try:
-        accel_magnitudes = [np.linalg.norm(np.array(acc)) if isinstance(acc, (list, np.ndarray)) else 0 for acc in data["Acceleration in bodyframe"]]
-        max_accel_gs = max(accel_magnitudes) / 9.81 if accel_magnitudes else 0  # Convertir a G's
+        # Apilar una sola vez a (N, 3) y reducir con einsum en lugar de N llamadas a norm
+        max_accel_gs = 0
+        if len(data):
+            acc = data[ACCEL_COLS].to_numpy(dtype=float)
+            max_accel_gs = np.sqrt(np.einsum('ij,ij->i', acc, acc)).max() / 9.81  # Convertir a G's
         
-        # Calculate propellant used
-        initial_mass = data["Mass of the rocket"].iloc[0]
-        final_mass = data["Mass of the rocket"].iloc[-1]
+        # Reducciones directamente sobre los buffers de numpy, sin pasar por Series
+        mass = data["Mass of the rocket"].to_numpy()
+        initial_mass = float(mass[0])
+        final_mass = float(mass[-1])
         propellant_used = initial_mass - final_mass
         
         return {
-            "total_time": round(data["Simulation time"].iloc[-1], 2),
-            "max_range": round(data["Range"].iloc[-1] / 1000, 2),
-            "max_alt": round(data["Up coordinate"].max() / 1000, 3),
-            "max_speed": round(data["Velocity norm"].max(), 2),
-            "max_mach": round(data["Mach number"].max(), 2),
+            "total_time": round(float(data["Simulation time"].to_numpy()[-1]), 2),
+            "max_range": round(float(data["Range"].to_numpy()[-1]) / 1000, 2),
+            "max_alt": round(float(data["Up coordinate"].to_numpy().max()) / 1000, 3),
+            "max_speed": round(float(data["Velocity norm"].to_numpy().max()), 2),
+            "max_mach": round(float(data["Mach number"].to_numpy().max()), 2),
             "initial_mass": round(initial_mass, 3),
             "final_mass": round(final_mass, 3),
             "propellant_used": round(propellant_used, 3),
-            "max_accel_g": round(max_accel_gs, 2)
+            "max_accel_g": round(float(max_accel_gs), 2)
         }
     except Exception as e:
         st.error(f"Error calculating metrics: {e}")
         return {}
 
-def generate_pdf_report(chart_data, metrics, stability_df, title, include_plots=True, include_analysis=True):
-    """Generate a comprehensive PDF report with plots"""
+@st.cache_data(max_entries=4)
+def stability_figure_png(time, calibers, cm_x, cp_x, max_calibers):
+    """Figura de margen de estabilidad y posiciones CM/CP, renderizada como PNG"""
+    fig, ax1 = plt.subplots(figsize=(10, 6))
+    
+    # Plot stability margin
+    color = 'tab:blue'
+    ax1.set_xlabel('Time [s]')
+    ax1.set_ylabel('Stability Margin [calibers]', color=color)
+    line1 = ax1.plot(time, calibers, color=color, label='Stability Margin', linewidth=2)
+    ax1.tick_params(axis='y', labelcolor=color)
+    
+    # Add stability regions
+    ax1.axhspan(2.0, 4.0, alpha=0.2, color='green', label='Very Stable')
+    ax1.axhspan(1.5, 2.0, alpha=0.2, color='blue', label='Stable')
+    ax1.axhspan(1.0, 1.5, alpha=0.2, color='orange', label='Marginal')
+    ax1.axhspan(0.0, 1.0, alpha=0.2, color='red', label='Unstable')
+    
+    ax1.set_ylim(0, max(4, max_calibers * 1.1))
+    
+    # Second y-axis for CM-CP positions
+    ax2 = ax1.twinx()
+    color = 'tab:red'
+    ax2.set_ylabel('Position [m]', color=color)
+    line2 = ax2.plot(time, cm_x, color='purple', label='CM Position', linestyle='--', linewidth=2)
+    line3 = ax2.plot(time, cp_x, color='brown', label='CP Position', linestyle='--', linewidth=2)
+    ax2.tick_params(axis='y', labelcolor=color)
+    
+    # Combine legends
+    lines = line1 + line2 + line3
+    labels = [l.get_label() for l in lines]
+    ax1.legend(lines, labels, loc='upper right')
+    
+    ax2.set_title('Rocket Stability Analysis')
+    fig.tight_layout()
+    
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=150, bbox_inches='tight')
+    plt.close(fig)
+    return buf.getvalue()
+
+def generate_pdf_report(chart_data, launch, metrics, stability_df, stability_stats, title, include_plots=True, include_analysis=True, generated_at=None):
+    """Generate a comprehensive PDF report with plots (bytes del PDF)"""
+    generated_at = generated_at or pd.Timestamp.now()
     buffer = io.BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=A4, topMargin=0.5*inch)
     story = []
-    styles = getSampleStyleSheet()
+    styles = PDF_STYLES
     
     # Title
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=18,
-        spaceAfter=30,
-        alignment=1
-    )
-    story.append(Paragraph(title, title_style))
+    story.append(Paragraph(title, PDF_TITLE_STYLE))
     
     # Simulation Overview
     story.append(Paragraph("Simulation Overview", styles['Heading2']))
@@ -85,25 +380,16 @@ def generate_pdf_report(chart_data, metrics, stability_df, title, include_plots=
     # Key metrics table
     overview_data = [
         ['Parameter', 'Value', 'Parameter', 'Value'],
-        ['Rocket', chart_data['Rocket name'].iloc[0], 'Location', chart_data['Location name'].iloc[0]],
+        ['Rocket', launch.rocket, 'Location', launch.location],
         ['Total Time', f"{metrics['total_time']} s", 'Max Altitude', f"{metrics['max_alt']} km"],
         ['Max Range', f"{metrics['max_range']} km", 'Max Speed', f"{metrics['max_speed']} m/s"],
         ['Max Mach', f"{metrics['max_mach']}", 'Max G-Force', f"{metrics['max_accel_g']} G"],
         ['Initial Mass', f"{metrics['initial_mass']} kg", 'Final Mass', f"{metrics['final_mass']} kg"],
-        ['Propellant Used', f"{metrics['propellant_used']} kg", 'Launch Site', f"{chart_data['Location Latitude'].iloc[0]:.3f}°S, {chart_data['Location Longitude'].iloc[0]:.3f}°W"],
+        ['Propellant Used', f"{metrics['propellant_used']} kg", 'Launch Site', f"{launch.latitude:.3f}°S, {launch.longitude:.3f}°W"],
     ]
     
     overview_table = Table(overview_data, colWidths=[1.5*inch, 1.5*inch, 1.5*inch, 1.5*inch])
-    overview_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    overview_table.setStyle(OVERVIEW_TABLE_STYLE)
     story.append(overview_table)
     story.append(Spacer(1, 0.3*inch))
     
@@ -112,7 +398,7 @@ def generate_pdf_report(chart_data, metrics, stability_df, title, include_plots=
         story.append(Paragraph("Performance Plots", styles['Heading2']))
         
         # Create and add plots
-        plots = generate_performance_plots(chart_data, stability_df)
+        plots = generate_performance_plots(chart_data, stability_df, stability_stats)
         for plot_buffer in plots:
             story.append(Image(plot_buffer, width=6*inch, height=4*inch))
             story.append(Spacer(1, 0.2*inch))
@@ -121,27 +407,18 @@ def generate_pdf_report(chart_data, metrics, stability_df, title, include_plots=
         # Stability Analysis Section
         story.append(Paragraph("Stability Analysis", styles['Heading2']))
         
-        stability_data = [
-            ['Stability Metric', 'Value', 'Status'],
-            ['Minimum Stability', f"{stability_df['stability_calibers'].min():.2f} calibers", 
-             stability_df.loc[stability_df['stability_calibers'].idxmin(), 'status']],
-            ['Maximum Stability', f"{stability_df['stability_calibers'].max():.2f} calibers", 
-             stability_df.loc[stability_df['stability_calibers'].idxmax(), 'status']],
-            ['Average Stability', f"{stability_df['stability_calibers'].mean():.2f} calibers", 
-             'N/A'],
-            ['Final Stability', f"{stability_df['stability_calibers'].iloc[-1]:.2f} calibers", 
-             stability_df['status'].iloc[-1]],
+        stability_data = [['Stability Metric', 'Value', 'Status']] + [
+            [label, f"{stability_stats[key]:.2f} calibers", stability_stats.get(f"{key}_status", 'N/A')]
+            for label, key in (
+                ('Minimum Stability', 'min'),
+                ('Maximum Stability', 'max'),
+                ('Average Stability', 'mean'),
+                ('Final Stability', 'final'),
+            )
         ]
         
         stability_table = Table(stability_data, colWidths=[2*inch, 1.5*inch, 1.5*inch])
-        stability_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.lightblue),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        stability_table.setStyle(STABILITY_TABLE_STYLE)
         story.append(stability_table)
         story.append(Spacer(1, 0.3*inch))
         
@@ -169,7 +446,7 @@ def generate_pdf_report(chart_data, metrics, stability_df, title, include_plots=
         risk_assessment.append("⚠️ High range - ensure adequate safety zone")
     if max_alt_km > 2:
         risk_assessment.append("⚠️ High altitude - consider airspace regulations")
-    if stability_df['stability_calibers'].min() < 1.0:
+    if stability_stats['min'] < 1.0:
         risk_assessment.append("🚨 Stability margin below safe minimum")
     if metrics['max_accel_g'] > 15:
         risk_assessment.append("⚠️ High acceleration - verify structural integrity")
@@ -183,20 +460,19 @@ def generate_pdf_report(chart_data, metrics, stability_df, title, include_plots=
     story.append(Spacer(1, 0.3*inch))
     
     # Footer
-    story.append(Paragraph(f"Report generated on {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}", 
+    story.append(Paragraph(f"Report generated on {generated_at.strftime('%Y-%m-%d %H:%M:%S')}", 
                           styles['Italic']))
     
-    # Build PDF
+    # Build PDF: se devuelven los bytes directamente, igual que los otros exportadores
     doc.build(story)
-    buffer.seek(0)
-    return buffer
+    return buffer.getvalue()
 
-def generate_performance_plots(chart_data, stability_df):
+def generate_performance_plots(chart_data, stability_df, stability_stats):
     """Generate matplotlib plots for PDF export"""
     plot_buffers = []
     
     # Compress data for plotting
-    chart_data_compressed = compress_data(chart_data)
+    chart_data_compressed = load_chart_data(chart_data)
     stability_compressed = compress_data(stability_df)
     
     # Plot 1: Altitude and Speed vs Time
@@ -266,93 +542,64 @@ def generate_performance_plots(chart_data, stability_df):
     plot_buffers.append(buf3)
     plt.close(fig3)
     
-    # Plot 4: Stability Analysis
-    fig4, ax1 = plt.subplots(figsize=(10, 6))
-    
-    # Plot stability margin
-    color = 'tab:blue'
-    ax1.set_xlabel('Time [s]')
-    ax1.set_ylabel('Stability Margin [calibers]', color=color)
-    line1 = ax1.plot(stability_compressed['time'], stability_compressed['stability_calibers'], 
-                     color=color, label='Stability Margin', linewidth=2)
-    ax1.tick_params(axis='y', labelcolor=color)
-    
-    # Add stability regions
-    ax1.axhspan(2.0, 4.0, alpha=0.2, color='green', label='Very Stable')
-    ax1.axhspan(1.5, 2.0, alpha=0.2, color='blue', label='Stable')
-    ax1.axhspan(1.0, 1.5, alpha=0.2, color='orange', label='Marginal')
-    ax1.axhspan(0.0, 1.0, alpha=0.2, color='red', label='Unstable')
-    
-    ax1.set_ylim(0, max(4, stability_df['stability_calibers'].max() * 1.1))
-    
-    # Second y-axis for CM-CP positions
-    ax2 = ax1.twinx()
-    color = 'tab:red'
-    ax2.set_ylabel('Position [m]', color=color)
-    line2 = ax2.plot(stability_compressed['time'], stability_compressed['cm_x'], 
-                     color='purple', label='CM Position', linestyle='--', linewidth=2)
-    line3 = ax2.plot(stability_compressed['time'], stability_compressed['cp_x'], 
-                     color='brown', label='CP Position', linestyle='--', linewidth=2)
-    ax2.tick_params(axis='y', labelcolor=color)
-    
-    # Combine legends
-    lines = line1 + line2 + line3
-    labels = [l.get_label() for l in lines]
-    ax1.legend(lines, labels, loc='upper right')
-    
-    plt.title('Rocket Stability Analysis')
-    plt.tight_layout()
-    
-    buf4 = io.BytesIO()
-    plt.savefig(buf4, format='png', dpi=150, bbox_inches='tight')
-    buf4.seek(0)
-    plot_buffers.append(buf4)
-    plt.close(fig4)
+    # Plot 4: Stability Analysis (la misma figura cacheada que muestra la página)
+    plot_buffers.append(io.BytesIO(stability_figure_png(
+        stability_compressed['time'].to_numpy(),
+        stability_compressed['stability_calibers'].to_numpy(),
+        stability_compressed['cm_x'].to_numpy(),
+        stability_compressed['cp_x'].to_numpy(),
+        stability_stats['max']
+    )))
     
     return plot_buffers
 
 def generate_csv_export(chart_data, stability_df):
     """Generate CSV export of simulation data"""
-    # Combine main data with stability metrics
-    export_data = chart_data.copy()
-    
-    # Add stability columns
-    export_data['stability_calibers'] = stability_df['stability_calibers']
-    export_data['stability_status'] = stability_df['status']
-    export_data['cm_cp_distance'] = stability_df['cm_cp_distance']
-    
-    return export_data.to_csv(index=False)
+    # Combine main data with stability metrics (aligned by row index)
+    return add_stability_columns(chart_data, stability_df).to_csv(index=False)
+
+@st.cache_data(max_entries=1)
+def cached_csv_export(_stability_df, data_version):
+    """CSV en bytes con todas las columnas del parquet, generado una vez por simulación (`data_version` es la clave de caché)"""
+    # La exportación de datos crudos lee el archivo completo, no la proyección USED_COLUMNS de los gráficos,
+    # y conserva float64 (el float32 de read_simulation_file es solo para métricas y gráficos)
+    data = expand_vector_columns(pd.read_parquet(SIM_DATA_PATH, engine="pyarrow"), dtype=np.float64)
+    # generate_csv_export verifica que _stability_df corresponda a las mismas filas y tiempos que el archivo
+    return generate_csv_export(data, _stability_df).encode('utf-8')
 
-def generate_json_summary(metrics, stability_df):
-    """Generate JSON summary of key results"""
+def generate_json_summary(metrics, stability_df, stability_stats, generated_at=None):
+    """Generate JSON summary of key results (UTF-8 bytes, listos para st.download_button)"""
+    generated_at = generated_at or pd.Timestamp.now()
+    # Serie temporal directamente desde los arrays, sin pasar por to_dict('records')
+    time = stability_df['time'].to_numpy()
+    calibers = stability_df['stability_calibers'].to_numpy()
+    stability_timeline = [
+        {'time': t, 'stability_calibers': c} for t, c in zip(time.tolist(), calibers.tolist())
+    ]
     summary = {
         'simulation_metrics': metrics,
         'stability_analysis': {
-            'min_stability': float(stability_df['stability_calibers'].min()),
-            'max_stability': float(stability_df['stability_calibers'].max()),
-            'avg_stability': float(stability_df['stability_calibers'].mean()),
-            'final_stability': float(stability_df['stability_calibers'].iloc[-1]),
-            'min_stability_status': stability_df.loc[stability_df['stability_calibers'].idxmin(), 'status'],
-            'stability_timeline': stability_df[['time', 'stability_calibers']].to_dict('records')
+            'min_stability': stability_stats['min'],
+            'max_stability': stability_stats['max'],
+            'avg_stability': stability_stats['mean'],
+            'final_stability': stability_stats['final'],
+            'min_stability_status': stability_stats['min_status'],
+            'stability_timeline': stability_timeline
         },
         'export_info': {
-            'timestamp': pd.Timestamp.now().isoformat(),
+            'timestamp': generated_at.isoformat(),
             'version': '1.0'
         }
     }
     
-    return json.dumps(summary, indent=2)
-
-# Cargar y preparar datos
-try:
-    chart_data = load_simulation_data()
-    if chart_data.empty:
-        st.error("No simulation data found. Please run a simulation first.")
-        st.stop()
-        
-    chart_data_compressed = compress_data(chart_data)
-    metrics = calculate_metrics(chart_data)
+    # orjson serializa directamente a bytes y entiende escalares de numpy,
+    # evitando el overhead de json.dumps sobre el timeline completo
+    return orjson.dumps(summary, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
 
+# Secciones del dashboard: cada una es un fragmento que se re-ejecuta por separado
+@st.fragment
+def render_parameters(chart_data, launch):
+    """Parámetros de lanzamiento, condiciones iniciales y ambientales"""
     st.subheader("Simulation Parameters")
     
     # Crear tres columnas para los parámetros
@@ -361,90 +608,75 @@ try:
     with param_col1:
         st.write("📌 Launch Configuration")
         st.info(f"""
-        **Rocket**: {chart_data['Rocket name'].iloc[0]}
-        **Location**: {chart_data['Location name'].iloc[0]}
-        **Coordinates**: {chart_data['Location Latitude'].iloc[0]:.3f}°S, {chart_data['Location Longitude'].iloc[0]:.3f}°W
+        **Rocket**: {launch.rocket}
+        **Location**: {launch.location}
+        **Coordinates**: {launch.latitude:.3f}°S, {launch.longitude:.3f}°W
         """)
 
     with param_col2:
         st.write("🎯 Initial Conditions")
-        # Crear un DataFrame con los datos iniciales
-        initial_data = pd.DataFrame({
-            "Parameter": ["Launch Elevation", "Initial Mass", "Initial Velocity"],
-            "Value": [
-                f"{chart_data['Pitch Angle'].iloc[0]:.1f}°",
-                f"{chart_data['Mass of the rocket'].iloc[0]:.2f} kg",
-                f"{chart_data['Velocity norm'].iloc[0]:.1f} m/s"
-            ]
-        })
-        st.dataframe(initial_data, hide_index=True)
+        # Tabla markdown con los datos iniciales (3 filas, sin DataFrame)
+        st.markdown(markdown_table([
+            ("Launch Elevation", f"{chart_data['Pitch Angle'].iat[0]:.1f}°"),
+            ("Initial Mass", f"{chart_data['Mass of the rocket'].iat[0]:.2f} kg"),
+            ("Initial Velocity", f"{chart_data['Velocity norm'].iat[0]:.1f} m/s")
+        ]))
 
     with param_col3:
         st.write("🌡️ Environmental Conditions")
-        env_data = pd.DataFrame({
-            "Parameter": ["Density", "Pressure", "Speed of Sound"],
-            "Value": [
-                f"{chart_data['Density of the atmosphere'].iloc[0]:.3f} kg/m³",
-                f"{chart_data['Ambient pressure'].iloc[0]/1000:.1f} kPa",
-                f"{chart_data['Speed of sound'].iloc[0]:.1f} m/s"
-            ]
-        })
-        st.dataframe(env_data, hide_index=True)
-
-    # Línea divisoria
-    st.markdown("---")
+        st.markdown(markdown_table([
+            ("Density", f"{chart_data['Density of the atmosphere'].iat[0]:.3f} kg/m³"),
+            ("Pressure", f"{chart_data['Ambient pressure'].iat[0]/1000:.1f} kPa"),
+            ("Speed of Sound", f"{chart_data['Speed of sound'].iat[0]:.1f} m/s")
+        ]))
 
-    # Layout de métricas
+@st.fragment
+def render_metrics(metrics, chart_data):
+    """Métricas principales de rendimiento"""
+    # Layout de métricas (ya redondeadas en calculate_metrics)
     st.subheader("Rocket Performance Metrics")
-    col1, col2, col3 = st.columns(3)
-    col4, col5, col6 = st.columns(3)
-    col7, col8, col9 = st.columns(3)
+    for row in METRIC_LAYOUT:
+        for col, (key, label, unit) in zip(st.columns(len(row)), row):
+            col.metric(label, f"{metrics[key]}{unit}")
     col_landing = st.columns(1)
 
-    # Primera fila de métricas
-    col1.metric("Total Flight Time", f"{metrics['total_time']}s")
-    col2.metric("Max Range", f"{metrics['max_range']}km")
-    col3.metric("Max Altitude", f"{metrics['max_alt']}km")
-
-    # Segunda fila de métricas
-    col4.metric("Initial Mass", f"{metrics['initial_mass']}kg")
-    col5.metric("Final Mass", f"{metrics['final_mass']}kg")
-    col6.metric("Propellant Used", f"{metrics['propellant_used']}kg")
-
-    # Tercera fila de métricas
-    col7.metric("Max Speed", f"{metrics['max_speed']}m/s")
-    col8.metric("Max Mach", f"{metrics['max_mach']}")
-    col9.metric("Max G-Force", f"{metrics['max_accel_g']}G")
-
     # Coordenadas de aterrizaje
     col_landing[0].metric("Landing Coordinates", 
-                         f"{abs(round(chart_data['Latitude'].iloc[-1], 1))}° S, {abs(round(chart_data['Longitude'].iloc[-1], 1))}° W")
+                         f"{abs(round(chart_data['Latitude'].iat[-1], 1))}° S, {abs(round(chart_data['Longitude'].iat[-1], 1))}° W")
 
+@st.fragment
+def render_trajectory_map(launch, chart_data_compressed):
+    """Mapa 3D de la trayectoria"""
     # Mapa de trayectoria
     st.subheader("Trajectory Overview")
-    trajectory_data = pd.DataFrame({
-        'Latitude': chart_data_compressed["Latitude"],
-        'Longitude': chart_data_compressed["Longitude"],
-        'Altitude': chart_data_compressed["Altitude"]
-    })
-
-    map_config = {
-        "version": "v1",
-        "config": {
-            "mapState": {
-                "bearing": 0,
-                "latitude": float(chart_data["Location Latitude"].iloc[0]),
-                "longitude": float(chart_data["Location Longitude"].iloc[0]),
-                "pitch": 60,
-                "zoom": 9,
+    trajectory_data = {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "geometry": {
+                    "type": "LineString",
+                    "coordinates": trajectory_coordinates(
+                        chart_data_compressed["Longitude"].to_numpy(),
+                        chart_data_compressed["Latitude"].to_numpy(),
+                        chart_data_compressed["Altitude"].to_numpy()
+                    )
+                },
+                "properties": {
+                    "name": "Flight Path"
+                }
             }
-        }
+        ]
     }
 
-    map_1 = KeplerGl(data={"trajectory": trajectory_data})
-    map_1.config = map_config
+    map_config = centered_map_config(TRAJECTORY_MAP_CONFIG, launch.latitude, launch.longitude)
+
+    map_1 = build_kepler_map("trajectory", to_json(trajectory_data), to_json(map_config))
     keplergl_static(map_1, height=800, width=1400, center_map=True)
 
+@st.fragment
+def render_performance_charts(chart_data_compressed):
+    """Gráficos de rendimiento"""
     # Gráficos de rendimiento
     st.subheader("Performance Charts")
     chart_col1, chart_col2, chart_col3 = st.columns(3)
@@ -454,170 +686,91 @@ try:
     # Primera fila de gráficos
     with chart_col1:
         st.write('Altitude [m] & Speed [m/s] vs Time [s]')
-        st.line_chart(chart_data_compressed, 
-                     x="Simulation time", 
+        st.line_chart(chart_data_compressed[["Simulation time", "Up coordinate", "Velocity norm"]],
+                     x="Simulation time",
                      y=["Up coordinate", "Velocity norm"])
 
     with chart_col2:
         st.write('Flight Path - Altitude [m] vs Range [m]')
-        st.line_chart(chart_data_compressed,
+        st.line_chart(chart_data_compressed[["Range", "Up coordinate"]],
                      x="Range",
                      y="Up coordinate")
 
     with chart_col3:
         st.write('Aerodynamic Parameters - Mach [-] & AoA [°] vs Time [s]')
-        st.line_chart(chart_data_compressed,
+        st.line_chart(chart_data_compressed[["Simulation time", "Mach number", "Angle of attack"]],
                      x="Simulation time",
                      y=["Mach number", "Angle of attack"])
 
     # Segunda fila de gráficos
     with chart_col4:
         st.write('Forces Analysis [N] vs Time [s]')
-        st.line_chart(chart_data_compressed,
+        st.line_chart(chart_data_compressed[["Simulation time", "Thrust", "Lift force in bodyframe", "Drag force in bodyframe"]],
                      x="Simulation time",
                      y=["Thrust", "Lift force in bodyframe", "Drag force in bodyframe"])
 
     with chart_col5:
         st.write('Mass [kg] & Altitude [m] vs Time [s]')
-        st.line_chart(chart_data_compressed,
+        st.line_chart(chart_data_compressed[["Simulation time", "Mass of the rocket", "Up coordinate"]],
                      x="Simulation time",
                      y=["Mass of the rocket", "Up coordinate"])
 
     with chart_col6:
         st.write('Attitude Analysis - Euler Angles [°] vs Time [s]')
-        st.line_chart(chart_data_compressed,
+        st.line_chart(chart_data_compressed[["Simulation time", "Pitch Angle", "Roll Angle", "Yaw Angle"]],
                      x="Simulation time",
                      y=["Pitch Angle", "Roll Angle", "Yaw Angle"])
     
     # Tercera fila de gráficos
     with chart_col7:
         st.write('Velocity Components [m/s] vs Time [s]')
-        st.line_chart(chart_data_compressed,
+        st.line_chart(chart_data_compressed[["Simulation time", "v_bx", "v_by", "v_bz"]],
                     x="Simulation time",
                     y=["v_bx", "v_by", "v_bz"])
 
     with chart_col8:
         st.write('Atmospheric Conditions vs Altitude [m]')
-        # Crear un DataFrame temporal normalizado para mejor visualización
-        atm_data = chart_data_compressed.copy()
-        atm_data['Normalized Density'] = atm_data['Density of the atmosphere'] / atm_data['Density of the atmosphere'].max()
-        atm_data['Normalized Pressure'] = atm_data['Ambient pressure'] / atm_data['Ambient pressure'].max()
+        # DataFrame normalizado de solo tres columnas para mejor visualización
+        atm_data = atmospheric_profile(
+            chart_data_compressed['Up coordinate'].to_numpy(),
+            chart_data_compressed['Density of the atmosphere'].to_numpy(),
+            chart_data_compressed['Ambient pressure'].to_numpy()
+        )
         st.line_chart(atm_data,
                     x="Up coordinate",
                     y=["Normalized Density", "Normalized Pressure"])
 
     with chart_col9:
         st.write('Aerodynamic Coefficients [-] vs Time [s]')
-        st.line_chart(chart_data_compressed,
+        st.line_chart(chart_data_compressed[["Simulation time", "Drag coefficient", "Lift coefficient"]],
                      x="Simulation time",
                      y=["Drag coefficient", "Lift coefficient"])
 
-    # Enhanced Stability Analysis
-    st.subheader("🚀 Advanced Stability Analysis")
-
-    # Calculate stability metrics
-    stability_metrics = []
-
-    for i in range(len(chart_data)):
-        try:
-            cm = np.array(chart_data['Center of mass in bodyframe'].iloc[i])
-            cp = np.array(chart_data['Center of pressure in bodyframe'].iloc[i])
-            time = chart_data['Simulation time'].iloc[i]
-            
-            # Calculate distance between CM and CP
-            cm_cp_distance = np.linalg.norm(cp - cm)
-            
-            # Calculate stability margin in calibers (rocket diameters)
-            rocket_diameter = 0.103  # meters from your rocket config
-            stability_calibers = cm_cp_distance / rocket_diameter
-            
-            # Determine stability status
-            if stability_calibers > 2.0:
-                status = "Very Stable"
-                color = "green"
-            elif stability_calibers > 1.5:
-                status = "Stable"
-                color = "blue"
-            elif stability_calibers > 1.0:
-                status = "Marginally Stable"
-                color = "orange"
-            else:
-                status = "Unstable"
-                color = "red"
-            
-            stability_metrics.append({
-                'time': time,
-                'cm_cp_distance': cm_cp_distance,
-                'stability_calibers': stability_calibers,
-                'status': status,
-                'color': color,
-                'cm_x': cm[0],
-                'cp_x': cp[0]
-            })
-        except Exception as e:
-            # Skip this data point if there's an error
-            continue
-
-    if not stability_metrics:
-        st.error("No stability data available. Please check your simulation data.")
-        st.stop()
-        
-    stability_df = pd.DataFrame(stability_metrics)
-    stability_compressed = compress_data(stability_df)
-
+@st.fragment
+def render_stability(stability_df, stability_compressed, stability_stats):
+    """Análisis de estabilidad CM/CP"""
     # Create columns for stability display
     stab_col1, stab_col2, stab_col3 = st.columns([2, 1, 1])
 
     with stab_col1:
         st.write("**Stability Margin Evolution**")
         
-        # Create a more informative stability chart
-        fig, ax1 = plt.subplots(figsize=(10, 6))
-        
-        # Plot stability margin
-        color = 'tab:blue'
-        ax1.set_xlabel('Time [s]')
-        ax1.set_ylabel('Stability Margin [calibers]', color=color)
-        line1 = ax1.plot(stability_compressed['time'], stability_compressed['stability_calibers'], 
-                         color=color, label='Stability Margin', linewidth=2)
-        ax1.tick_params(axis='y', labelcolor=color)
-        
-        # Add stability regions
-        ax1.axhspan(2.0, 4.0, alpha=0.2, color='green', label='Very Stable')
-        ax1.axhspan(1.5, 2.0, alpha=0.2, color='blue', label='Stable')
-        ax1.axhspan(1.0, 1.5, alpha=0.2, color='orange', label='Marginal')
-        ax1.axhspan(0.0, 1.0, alpha=0.2, color='red', label='Unstable')
-        
-        ax1.set_ylim(0, max(4, stability_df['stability_calibers'].max() * 1.1))
-        ax1.legend(loc='upper left')
-        
-        # Second y-axis for CM-CP positions
-        ax2 = ax1.twinx()
-        color = 'tab:red'
-        ax2.set_ylabel('Position [m]', color=color)
-        line2 = ax2.plot(stability_compressed['time'], stability_compressed['cm_x'], 
-                         color='purple', label='CM Position', linestyle='--', linewidth=2)
-        line3 = ax2.plot(stability_compressed['time'], stability_compressed['cp_x'], 
-                         color='brown', label='CP Position', linestyle='--', linewidth=2)
-        ax2.tick_params(axis='y', labelcolor=color)
-        
-        # Combine legends
-        lines = line1 + line2 + line3
-        labels = [l.get_label() for l in lines]
-        ax1.legend(lines, labels, loc='upper right')
-        
-        plt.title('Rocket Stability Analysis')
-        plt.tight_layout()
-        st.pyplot(fig)
+        # Figura renderizada una vez por simulación y reutilizada en el PDF
+        st.image(stability_figure_png(
+            stability_compressed['time'].to_numpy(),
+            stability_compressed['stability_calibers'].to_numpy(),
+            stability_compressed['cm_x'].to_numpy(),
+            stability_compressed['cp_x'].to_numpy(),
+            stability_stats['max']
+        ), use_container_width=True)
 
     with stab_col2:
         st.write("**Stability Summary**")
         
         # Calculate key stability metrics
-        min_stability = stability_df['stability_calibers'].min()
-        max_stability = stability_df['stability_calibers'].max()
-        avg_stability = stability_df['stability_calibers'].mean()
-        final_stability = stability_df['stability_calibers'].iloc[-1]
+        min_stability = stability_stats['min']
+        max_stability = stability_stats['max']
+        final_stability = stability_stats['final']
         
         # Determine overall stability rating
         if min_stability > 1.5:
@@ -674,23 +827,26 @@ try:
     with cm_cp_col2:
         st.write("Stability Statistics")
         
+        # Estadísticas sobre el ndarray subyacente, sin pasar por la Series
+        separation = stability_df['cm_cp_distance'].to_numpy()
+        sep_initial, sep_final = separation[0], separation[-1]
         stats_data = {
             'Metric': ['Minimum Separation', 'Maximum Separation', 'Average Separation', 
                       'Initial Separation', 'Final Separation', 'Separation Change'],
             'Value': [
-                f"{stability_df['cm_cp_distance'].min():.3f} m",
-                f"{stability_df['cm_cp_distance'].max():.3f} m", 
-                f"{stability_df['cm_cp_distance'].mean():.3f} m",
-                f"{stability_df['cm_cp_distance'].iloc[0]:.3f} m",
-                f"{stability_df['cm_cp_distance'].iloc[-1]:.3f} m",
-                f"{(stability_df['cm_cp_distance'].iloc[-1] - stability_df['cm_cp_distance'].iloc[0]):.3f} m"
+                f"{separation.min():.3f} m",
+                f"{separation.max():.3f} m", 
+                f"{separation.mean():.3f} m",
+                f"{sep_initial:.3f} m",
+                f"{sep_final:.3f} m",
+                f"{(sep_final - sep_initial):.3f} m"
             ]
         }
         st.dataframe(pd.DataFrame(stats_data), use_container_width=True)
 
-    # Línea divisoria
-    st.markdown("---")
-
+@st.fragment
+def render_risk(chart_data, chart_data_compressed, launch, metrics):
+    """Área de seguridad y mapa de riesgo"""
     # Análisis de riesgo
     st.subheader("Risk Analysis")
     
@@ -707,63 +863,31 @@ try:
     }
 
     # Verificar si la trayectoria está dentro de los límites
-    trajectory_in_bounds = (
-        chart_data['Range'].max() / 1000 <= safety_box['length'] and  # Convertir m a km
-        abs(chart_data['East coordinate']).max() / 1000 <= safety_box['width'] / 2 and
-        abs(chart_data['North coordinate']).max() / 1000 <= safety_box['width'] / 2 and
-        chart_data['Up coordinate'].max() / 1000 <= safety_box['height']
+    # Una sola reducción min/max sobre el bloque de las cuatro columnas
+    bounds = chart_data[BOUNDS_COLUMNS].to_numpy()
+    lower, upper = bounds.min(axis=0), bounds.max(axis=0)
+    # Este y Norte se comparan en valor absoluto: max(|x|) = max(max, -min)
+    upper[1:3] = np.maximum(upper[1:3], -lower[1:3])
+    range_max, east_max, north_max, up_max = upper
+    trajectory_in_bounds = bool(
+        range_max <= safety_box['length'] * 1000 and  # Convertir km a m
+        east_max <= safety_box['width'] * 500 and
+        north_max <= safety_box['width'] * 500 and
+        up_max <= safety_box['height'] * 1000
     )
 
     # Crear área de seguridad para el mapa
-    center_lat = chart_data['Location Latitude'].iloc[0]
-    center_lon = chart_data['Location Longitude'].iloc[0]
+    center_lat = launch.latitude
+    center_lon = launch.longitude
     
-    def create_safety_box(center_lat, center_lon, width_km, length_km):
-        """Crea un polígono rectangular para el área segura"""
-        lat_delta = (width_km / 2) / 111.32  # 1 grado ≈ 111.32 km
-        lon_delta = (length_km / 2) / (111.32 * cos(center_lat * pi / 180))
-        
-        return [
-            [center_lon - lon_delta, center_lat - lat_delta],
-            [center_lon + lon_delta, center_lat - lat_delta],
-            [center_lon + lon_delta, center_lat + lat_delta],
-            [center_lon - lon_delta, center_lat + lat_delta],
-            [center_lon - lon_delta, center_lat - lat_delta]
-        ]
-
     # Crear GeoJSON con área de seguridad
     safety_area = create_safety_box(center_lat, center_lon, 
                                   safety_box['width'], 
                                   safety_box['length'])
 
-    geojson_dict = {
-        "type": "FeatureCollection",
-        "features": [
-            {
-                "type": "Feature",
-                "geometry": {
-                    "type": "LineString",
-                    "coordinates": list(zip(chart_data_compressed['Longitude'], 
-                                         chart_data_compressed['Latitude']))
-                },
-                "properties": {
-                    "name": "Flight Path",
-                    "color": [255, 0, 0]
-                }
-            },
-            {
-                "type": "Feature",
-                "geometry": {
-                    "type": "Polygon",
-                    "coordinates": [safety_area]
-                },
-                "properties": {
-                    "name": "Safety Area",
-                    "color": [0, 255, 0, 80]
-                }
-            }
-        ]
-    }
+    risk_geojson = risk_geojson_json(chart_data_compressed['Longitude'].to_numpy(),
+                                     chart_data_compressed['Latitude'].to_numpy(),
+                                     safety_area)
 
     # Mostrar resultados del análisis
     risk_col1, risk_col2 = st.columns([2, 1])
@@ -785,33 +909,13 @@ try:
         """)
 
     with risk_col1:
-        risk_map = KeplerGl(height=600, data={"risk_layer": geojson_dict})
-        risk_map.config = {
-            "version": "v1",
-            "config": {
-                "mapState": {
-                    "bearing": 0,
-                    "latitude": center_lat,
-                    "longitude": center_lon,
-                    "pitch": 45,
-                    "zoom": 12,
-                },
-                "visState": {
-                    "layers": [
-                        {
-                            "type": "geojson",
-                            "config": {
-                                "dataId": "risk_layer",
-                                "visible": True,
-                                "opacity": 0.8
-                            }
-                        }
-                    ]
-                }
-            }
-        }
+        risk_config = centered_map_config(RISK_MAP_CONFIG, center_lat, center_lon)
+        risk_map = build_kepler_map("risk_layer", risk_geojson, to_json(risk_config), height=600)
         keplergl_static(risk_map, height=600, width=1000, center_map=True)
 
+@st.fragment
+def render_export(chart_data, launch, metrics, stability_df, stability_stats, data_version):
+    """Exportación de reportes (PDF, CSV, JSON)"""
     # PDF Export Section
     st.markdown("---")
     st.subheader("📊 Export Report")
@@ -838,45 +942,51 @@ try:
         
         if st.button("📥 Generate Export", use_container_width=True):
             with st.spinner("Generating report..."):
+                # Una sola marca de tiempo para el nombre del archivo y el contenido exportado
+                generated_at = pd.Timestamp.now()
+                file_stamp = generated_at.strftime('%Y%m%d_%H%M%S')
                 try:
                     if export_format == "PDF Report":
-                        pdf_buffer = generate_pdf_report(
+                        pdf_bytes = generate_pdf_report(
                             chart_data, 
+                            launch,
                             metrics, 
                             stability_df,
+                            stability_stats,
                             report_title,
                             include_plots,
-                            include_analysis
+                            include_analysis,
+                            generated_at
                         )
                         
                         st.success("PDF report generated successfully!")
                         
                         st.download_button(
                             label="📄 Download PDF Report",
-                            data=pdf_buffer,
-                            file_name=f"rocket_simulation_report_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.pdf",
+                            data=pdf_bytes,
+                            file_name=f"rocket_simulation_report_{file_stamp}.pdf",
                             mime="application/pdf",
                             use_container_width=True
                         )
                         
                     elif export_format == "CSV Data":
-                        csv_data = generate_csv_export(chart_data, stability_df)
+                        csv_data = cached_csv_export(stability_df, data_version)
                         
                         st.download_button(
                             label="📊 Download CSV Data",
                             data=csv_data,
-                            file_name=f"rocket_simulation_data_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                            file_name=f"rocket_simulation_data_{file_stamp}.csv",
                             mime="text/csv",
                             use_container_width=True
                         )
                         
                     elif export_format == "Summary JSON":
-                        json_data = generate_json_summary(metrics, stability_df)
+                        json_data = generate_json_summary(metrics, stability_df, stability_stats, generated_at)
                         
                         st.download_button(
                             label="📋 Download JSON Summary",
                             data=json_data,
-                            file_name=f"rocket_simulation_summary_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.json",
+                            file_name=f"rocket_simulation_summary_{file_stamp}.json",
                             mime="application/json",
                             use_container_width=True
                         )
@@ -884,6 +994,43 @@ try:
                 except Exception as e:
                     st.error(f"Error generating report: {str(e)}")
 
+# Cargar y preparar datos
+try:
+    chart_data = load_simulation_data()
+    if chart_data.empty:
+        st.error("No simulation data found. Please run a simulation first.")
+        st.stop()
+        
+    chart_data_compressed = load_chart_data(chart_data)
+    metrics = calculate_metrics(chart_data)
+    launch = launch_info(chart_data)
+    data_version = os.path.getmtime(SIM_DATA_PATH)  # Clave de caché de los cálculos derivados
+
+    render_parameters(chart_data, launch)
+
+    # Línea divisoria
+    st.markdown("---")
+
+    render_metrics(metrics, chart_data)
+    render_trajectory_map(launch, chart_data_compressed)
+    render_performance_charts(chart_data_compressed)
+
+    # Enhanced Stability Analysis
+    st.subheader("🚀 Advanced Stability Analysis")
+
+    stability_df, stability_compressed, stability_stats = build_stability(chart_data, data_version)
+    if stability_df.empty or not stability_stats:
+        st.error("No stability data available. Please check your simulation data.")
+        st.stop()
+
+    render_stability(stability_df, stability_compressed, stability_stats)
+
+    # Línea divisoria
+    st.markdown("---")
+
+    render_risk(chart_data, chart_data_compressed, launch, metrics)
+    render_export(chart_data, launch, metrics, stability_df, stability_stats, data_version)
+
 except KeyError as e:
     st.error(f"Error: Columna no encontrada - {e}")
     if 'chart_data' in locals():
@@ -1,11 +1,37 @@
 import streamlit as st
+from collections import deque
 from src.utils import units
 
 st.title("Conversor de Unidades")
 
+HISTORY_LENGTH = 50  # Conversiones guardadas en el historial de la sesión
+
+@st.cache_data
+def all_conversions(magnitud):
+    """Unidades alcanzables desde la magnitud (el grafo de conversiones no cambia entre reruns)"""
+    return tuple(units.getAllConversions(magnitud))
+
+@st.cache_data
+def units_summary():
+    """Líneas de la sección 'Unidades disponibles', construidas una sola vez"""
+    return [f"**{label}**: {', '.join(all_conversions(key))}" for key, label in units.unitLabels.items()]
+
+@st.cache_data
+def conversion_lines(valor, unidad_origen, unidades):
+    """Líneas 'valor unidad = conv unidad' para cada unidad de la magnitud; solo se recalculan si cambia alguna entrada"""
+    conversiones = []
+    for unidad in unidades:
+        if unidad != unidad_origen:
+            try:
+                conv = units.convert(valor, unidad_origen, unidad)
+            except Exception:
+                continue
+            conversiones.append(f"{valor} {unidad_origen} = {conv:.6f} {unidad}")
+    return conversiones
+
 # Inicializar historial en la sesión
 if "conversion_history" not in st.session_state:
-    st.session_state.conversion_history = []
+    st.session_state.conversion_history = deque(maxlen=HISTORY_LENGTH)
 
 col1, col2 = st.columns(2)
 
@@ -14,7 +40,7 @@ magnitudes = list(units.unitLabels.keys())
 magnitud = col1.selectbox("Selecciona la magnitud", magnitudes, format_func=lambda x: units.unitLabels[x])
 
 # Unidades disponibles para la magnitud seleccionada
-unidades = units.getAllConversions(magnitud)
+unidades = all_conversions(magnitud)
 unidad_origen = col1.selectbox("Unidad de origen", unidades)
 unidad_destino = col1.selectbox("Unidad de destino", unidades, index=1 if len(unidades) > 1 else 0)
 
@@ -28,7 +54,7 @@ try:
 
     # Guardar en historial
     if col1.button("Agregar al historial"):
-        col1.session_state.conversion_history.append(
+        st.session_state.conversion_history.appendleft(
             f"{valor} {unidad_origen} = {resultado:.6f} {unidad_destino}"
         )
 except Exception as e:
@@ -37,20 +63,14 @@ except Exception as e:
 # Mostrar historial
 if st.session_state.conversion_history:
     col1.markdown("#### Historial de conversiones")
-    for item in reversed(col1.session_state.conversion_history):
-        col1.write(item)
+    # appendleft deja el historial ordenado del más reciente al más antiguo
+    col1.markdown("  \n".join(st.session_state.conversion_history))
 
 # Mostrar todas las conversiones posibles para el valor ingresado
 col2.markdown("#### Todas las conversiones posibles para este valor")
-for unidad in unidades:
-    if unidad != unidad_origen:
-        try:
-            conv = units.convert(valor, unidad_origen, unidad)
-            col2.write(f"{valor} {unidad_origen} = {conv:.6f} {unidad}")
-        except Exception:
-            continue
+# Un solo bloque markdown en lugar de un st.write por unidad
+col2.markdown("  \n".join(conversion_lines(valor, unidad_origen, unidades)))
 
 # Información adicional
 st.markdown("#### Unidades disponibles")
-for key, label in units.unitLabels.items():
-    st.write(f"**{label}**: {', '.join(units.getAllConversions(key))}")
\ No newline at end of file
+st.markdown("  \n".join(units_summary()))
\ No newline at end of file
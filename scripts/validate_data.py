@@ -1,23 +1,32 @@
-import json
+import functools
 import os
-from jsonschema import validate, ValidationError
+import orjson
+from jsonschema import Draft7Validator, validate, ValidationError
 
+@functools.lru_cache(maxsize=None)
 def load_schema(schema_name):
-    """Carga un esquema JSON"""
+    """Carga un esquema JSON (cada esquema se lee del disco una sola vez)"""
     schema_path = os.path.join('data', 'schemas', f'{schema_name}.schema.json')
-    with open(schema_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    with open(schema_path, 'rb') as f:
+        return orjson.loads(f.read())
 
-def validate_rocket_config(config_file):
+def rocket_validator():
+    """Validador del esquema de cohetes, compilado una sola vez"""
+    schema = load_schema('rocket')
+    Draft7Validator.check_schema(schema)
+    return Draft7Validator(schema)
+
+def validate_rocket_config(config_file, validator=None):
     """Valida un archivo de configuración de cohete"""
     try:
         # Cargar esquema y datos
-        schema = load_schema('rocket')
-        with open(config_file, 'r', encoding='utf-8') as f:
-            rocket_data = json.load(f)
+        if validator is None:
+            validator = rocket_validator()
+        with open(config_file, 'rb') as f:
+            rocket_data = orjson.loads(f.read())
         
         # Validar
-        validate(instance=rocket_data, schema=schema)
+        validator.validate(rocket_data)
         print(f"✅ Archivo válido: {os.path.basename(config_file)}")
         return True
     except ValidationError as e:
@@ -35,11 +44,19 @@ def validate_all_rockets():
     valid_count = 0
     total_count = 0
     
-    for filename in os.listdir(configs_dir):
-        if filename.endswith('.json'):
-            total_count += 1
-            if validate_rocket_config(os.path.join(configs_dir, filename)):
-                valid_count += 1
+    # El esquema se lee y compila una vez para todos los archivos
+    try:
+        validator = rocket_validator()
+    except Exception as e:
+        print(f"❌ Error cargando el esquema de cohetes: {str(e)}")
+        return
+    
+    with os.scandir(configs_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith('.json') and entry.is_file():
+                total_count += 1
+                if validate_rocket_config(entry.path, validator):
+                    valid_count += 1
     
     print(f"\nResumen: {valid_count}/{total_count} archivos válidos")
 
@@ -48,8 +65,8 @@ def validate_file(file_path, schema_name):
     try:
         # Cargar esquema y datos
         schema = load_schema(schema_name)
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(file_path, 'rb') as f:
+            data = orjson.loads(f.read())
         
         # Validar
         validate(instance=data, schema=schema)
@@ -10,7 +10,6 @@ and Barrowman stability calculations.
 
 External dependencies:
 numpy       -Numpy Python extension. http://numpy.org/
-scipy       -Scipy Python extension. https://www.scipy.org
 fluids      -For atmospheric properties (via Atmosphere class)
 
 Changelog:
@@ -21,215 +20,78 @@ Date          Name              Change
 
 import numpy as np
 import math
-from scipy import interpolate
 import logging
 
-class EnhancedAerodynamics:
-    def __init__(self, mach, angle_attack, height, atmosphere, rocket_data, current_mass_props):
-        logging.debug(f"Inicializando cálculos aerodinámicos: Mach={mach:.2f}, α={angle_attack:.1f}°, h={height:.1f}m")
-        try:
-            self.mach = mach
-            self.alpha = self._validate_angle(angle_attack)
-            self.height = height
-            self.atmosphere = atmosphere
-            self.rocket_data = rocket_data
-            self.mass_props = current_mass_props
-            
-            # Atmospheric properties
-            self.rho = atmosphere.give_dens(height)
-            self.temp = atmosphere.give_temp(height)
-            self.speed_of_sound = atmosphere.give_v_sonic(height)
-            self.velocity = mach * self.speed_of_sound
-            
-            # Reference parameters
-            self.ref_area = rocket_data['reference_area']  # [m²]
-            self.ref_diameter = rocket_data['fuselage']['diameter'] / 1000.0  # [m]
-            
-            # Calculate coefficients
-            self.cd = self._calculate_drag_coefficient()
-            self.cl = self._calculate_lift_coefficient()
-            self.xcp = self._calculate_pressure_center()
-            self.stability_margin = self._calculate_stability_margin()
-            
-            logging.debug(f"Coeficientes calculados: CD={self.cd:.3f}, CL={self.cl:.3f}, Stability={self.stability_margin:.2f} calibers")
-            
-        except Exception as e:
-            logging.error(f"Error en cálculos aerodinámicos: {str(e)}")
-            raise
+deg2rad = math.pi/180  # [rad/deg]
 
-    def _validate_angle(self, angle):
-        """Valida y ajusta el ángulo de ataque"""
-        a_max = 10  # [deg]
-        if abs(angle) >= a_max:
-            return a_max * (abs(angle)/angle)
-        return angle
+class EnhancedAeroGeometry:
+    """
+    Geometry-only terms of EnhancedAerodynamics.
 
-    def _calculate_drag_coefficient(self):
-        """Calculates total drag coefficient using component-based model"""
+    They depend on rocket_data alone, so they can be built once per rocket and
+    passed to every EnhancedAerodynamics evaluated during the flight.
+    """
+    def __init__(self, rocket_data):
+        self.rocket_data = rocket_data
+        
+        # Reference parameters
+        self.ref_area = rocket_data['reference_area']  # [m²]
+        self.ref_diameter = rocket_data['fuselage']['diameter'] / 1000.0  # [m]
+        
+        # Drag components (None if the geometry is incomplete; drag then uses the simple estimate)
         try:
-            # Calculate individual drag components
-            cd_skin_friction = self._calculate_skin_friction_drag()
-            cd_pressure = self._calculate_pressure_drag()
-            cd_base = self._calculate_base_drag()
-            cd_interference = self._calculate_interference_drag()
-            cd_wave = self._calculate_wave_drag()  # For transonic/supersonic
-            
-            # Sum all components for total drag
-            total_cd = cd_skin_friction + cd_pressure + cd_base + cd_interference + cd_wave
-            
-            # Apply transonic drag divergence correction
-            total_cd *= self._transonic_drag_correction()
-            
-            logging.debug(f"Drag components - Skin: {cd_skin_friction:.4f}, Pressure: {cd_pressure:.4f}, "
-                         f"Base: {cd_base:.4f}, Interference: {cd_interference:.4f}, Wave: {cd_wave:.4f}")
-            
-            return total_cd
-            
+            self._calculate_drag_geometry()
         except Exception as e:
-            logging.error(f"Error in drag calculation: {str(e)}")
-            # Fallback to simple model
-            return self._simple_drag_estimate()
+            logging.error(f"Error in drag geometry: {str(e)}")
+            self.L_ref = self.wetted_area_ratio = None
+            self.nose_shape_cd = self.nose_area_ratio = None
+            self.fins_pressure_cd = self.base_area_ratio = self.interference_cd = None
+        
+        # Barrowman
+        self.cn_alpha = self._calculate_normal_force_coefficients()
+        self.cp_positions = self._calculate_pressure_centers()
+        self.xcp_x = self._calculate_pressure_center()  # [m]
 
-    def _calculate_skin_friction_drag(self):
-        """Calculates skin friction drag for all components using Prandtl-Schlichting"""
-        # Calculate Reynolds number based on rocket length
-        L_ref = self.rocket_data['geometry']['total length'] / 1000.0  # [m]
-        mu = self._calculate_dynamic_viscosity()  # Dynamic viscosity
-        
-        Re_L = (self.rho * self.velocity * L_ref) / mu
-        
-        # Turbulent skin friction coefficient (Prandtl-Schlichting)
-        Cf = 0.074 / (Re_L ** 0.2)
-        
-        # Calculate wetted areas
-        A_wet_nose = self._calculate_nose_wetted_area()
-        A_wet_body = self._calculate_body_wetted_area()
-        A_wet_fins = self._calculate_fins_wetted_area()
-        
-        total_A_wet = A_wet_nose + A_wet_body + A_wet_fins
-        
-        # Surface roughness factor (1.0 for smooth, up to 1.5 for rough)
-        roughness_factor = self._get_surface_roughness_factor()
-        
-        # Compressibility correction
-        compressibility_factor = 1.0
-        if self.mach > 0.6:
-            compressibility_factor = 1 / (1 + 0.12 * self.mach**2)
-        
-        cd_skin = Cf * roughness_factor * compressibility_factor * (total_A_wet / self.ref_area)
+    def _calculate_drag_geometry(self):
+        """Calcula los factores geométricos de cada componente de arrastre"""
+        g = self.rocket_data
         
-        return cd_skin
-
-    def _calculate_pressure_drag(self):
-        """Calculates pressure (form) drag for nose cone and fins"""
-        cd_nose = self._calculate_nose_pressure_drag()
-        cd_fins = self._calculate_fins_pressure_drag()
+        # Skin friction: reference length and wetted-to-reference area ratio
+        self.L_ref = g['geometry']['total length'] / 1000.0  # [m]
+        total_A_wet = self._calculate_nose_wetted_area() + self._calculate_body_wetted_area() + self._calculate_fins_wetted_area()
+        self.wetted_area_ratio = total_A_wet / self.ref_area
         
-        return cd_nose + cd_fins
-
-    def _calculate_nose_pressure_drag(self):
-        """Calculates pressure drag for nose cone based on shape"""
-        nose_data = self.rocket_data['nosecone']
+        # Nose cone pressure drag (subsonic, before Mach correction)
+        nose_data = g['nosecone']
         shape = nose_data.get('shape', 'conical')
         fineness_ratio = nose_data['length'] / nose_data['diameter']
         
         # Base drag coefficients for different nose shapes (subsonic)
         if shape == 'parabolic':
-            cd_nose = 0.08 / (fineness_ratio ** 0.5)
+            self.nose_shape_cd = 0.08 / (fineness_ratio ** 0.5)
         elif shape == 'ogive':
-            cd_nose = 0.06 / (fineness_ratio ** 0.5)
+            self.nose_shape_cd = 0.06 / (fineness_ratio ** 0.5)
         else:  # conical
-            cd_nose = 0.10 / (fineness_ratio ** 0.5)
-        
-        # Mach number correction
-        if self.mach > 0.8:
-            cd_nose *= (1 + 0.2 * (self.mach - 0.8))
-        
-        return cd_nose * (self.ref_area / self._calculate_nose_frontal_area())
-
-    def _calculate_fins_pressure_drag(self):
-        """Calculates pressure drag for fins"""
-        fins_data = self.rocket_data['fins']
+            self.nose_shape_cd = 0.10 / (fineness_ratio ** 0.5)
+        self.nose_area_ratio = self.ref_area / self._calculate_nose_frontal_area()
         
-        # Fin thickness ratio (assuming 3mm thickness if not specified)
+        # Fins pressure drag (assuming 3mm thickness if not specified)
+        fins_data = g['fins']
         thickness = 3.0  # [mm]
         chord_avg = (fins_data['chord_root'] + fins_data['chord_tip']) / 2
         thickness_ratio = thickness / chord_avg
-        
-        # Form drag coefficient for fins
-        cd_fins_form = 2.0 * thickness_ratio * (self._calculate_fins_planform_area() / self.ref_area)
-        
-        return cd_fins_form
-
-    def _calculate_base_drag(self):
-        """Calculates base drag based on rear section geometry"""
-        rear_data = self.rocket_data['rear_section']
+        fin_planform_area = self._calculate_fins_planform_area()
+        self.fins_pressure_cd = 2.0 * thickness_ratio * (fin_planform_area / self.ref_area)
         
         # Base area
-        base_diameter = rear_data['diameter'] / 1000.0  # [m]
+        base_diameter = g['rear_section']['diameter'] / 1000.0  # [m]
         base_area = math.pi * (base_diameter / 2) ** 2
+        self.base_area_ratio = base_area / self.ref_area
         
-        # Base drag coefficient (empirical)
-        if self.mach < 0.8:
-            cd_base = 0.12 + 0.13 * self.mach**2
-        else:
-            cd_base = 0.25 / (1 + 0.5 * (self.mach - 0.8))
-        
-        return cd_base * (base_area / self.ref_area)
-
-    def _calculate_interference_drag(self):
-        """Calculates interference drag at fin-body junctions"""
-        fins_data = self.rocket_data['fins']
-        
-        # Interference drag factor (empirical)
-        K_int = 0.1  # 10% of fin drag
-        
-        # Estimate fin drag component
-        fin_planform_area = self._calculate_fins_planform_area()
+        # Interference drag at fin-body junctions (empirical, 10% of fin drag)
+        K_int = 0.1
         cd_fins_basic = 0.05 * (fin_planform_area / self.ref_area)
-        
-        cd_interference = K_int * cd_fins_basic * fins_data['N_fins']
-        
-        return cd_interference
-
-    def _calculate_wave_drag(self):
-        """Calculates wave drag for transonic/supersonic regimes"""
-        if self.mach < 0.8:
-            return 0.0
-        
-        # Wave drag becomes significant above Mach 0.8
-        if self.mach <= 1.2:
-            # Transonic drag rise
-            cd_wave = 0.2 * (self.mach - 0.8) ** 2
-        else:
-            # Supersonic wave drag
-            cd_wave = 0.4 / (self.mach ** 1.5)
-        
-        return cd_wave
-
-    def _transonic_drag_correction(self):
-        """Applies transonic drag divergence correction"""
-        if self.mach < 0.8:
-            return 1.0
-        elif self.mach <= 1.2:
-            # Drag divergence in transonic region
-            return 1.0 + 0.5 * ((self.mach - 0.8) / 0.4) ** 2
-        else:
-            return 1.2  # Constant factor for supersonic
-
-    def _calculate_dynamic_viscosity(self):
-        """Calculates dynamic viscosity using Sutherland's formula"""
-        T = self.temp  # [K]
-        # Sutherland's constants for air
-        C1 = 1.458e-6  # [kg/(m·s·K^0.5)]
-        S = 110.4      # [K]
-        
-        return (C1 * T**1.5) / (T + S)
-
-    def _get_surface_roughness_factor(self):
-        """Returns surface roughness multiplier (1.0 = smooth, >1.0 = rough)"""
-        # Could be enhanced with material-specific roughness values
-        return 1.1  # Slightly rough for painted surface
+        self.interference_cd = K_int * cd_fins_basic * fins_data['N_fins']
 
     # Geometry calculation methods
     def _calculate_nose_wetted_area(self):
@@ -277,27 +139,16 @@ class EnhancedAerodynamics:
         D = nose['diameter'] / 1000.0  # [m]
         return math.pi * (D/2) ** 2
 
-    def _simple_drag_estimate(self):
-        """Fallback simple drag estimation"""
-        # Basic drag coefficient estimation
-        base_cd = 0.3
-        mach_factor = 1.0 + 0.2 * abs(self.mach - 0.8) if self.mach > 0.8 else 1.0
-        alpha_factor = 1.0 + 0.1 * abs(self.alpha)
-        
-        return base_cd * mach_factor * alpha_factor
-
-    # Stability and Lift Calculations (enhanced with your existing methods)
+    # Barrowman coefficients and pressure centers (geometry only)
     def _calculate_normal_force_coefficients(self):
         """Calcula los coeficientes de fuerza normal para cada componente usando Barrowman"""
         g = self.rocket_data
-        alpha_rad = np.radians(self.alpha)
-        
+
         # Nose cone [Barrowman]
         Cn_alpha_nose = 2.0
         
         # Body tube [Barrowman - negligible for slender bodies at small alpha]
         body_diameter = g['fuselage']['diameter'] / 1000.0
-        body_length = g['fuselage']['length'] / 1000.0
         Cn_alpha_body = 0.0  # Small contribution compared to fins
         
         # Fins [Barrowman method]
@@ -313,7 +164,9 @@ class EnhancedAerodynamics:
         
         # Fin normal force coefficient derivative
         AR = (2 * s) / (cr + ct)  # Aspect ratio approximation
-        Cn_alpha_fins = (K_fin * 4 * n * (s / d)**2) / (1 + math.sqrt(1 + (2 * AR)**2))
+        s_d = s / d
+        two_AR = 2 * AR
+        Cn_alpha_fins = (K_fin * 4 * n * s_d * s_d) / (1 + math.sqrt(1 + two_AR * two_AR))
         
         return {
             'nose': Cn_alpha_nose,
@@ -352,41 +205,168 @@ class EnhancedAerodynamics:
             'fins': cp_fins
         }
 
+    def _calculate_pressure_center(self):
+        """Calcula la posición axial del centro de presión total"""
+        Cn_coeffs = self.cn_alpha
+        cp_positions = self.cp_positions
+        
+        total_Cn_alpha = sum(Cn_coeffs.values())
+        if total_Cn_alpha == 0:
+            return 0.0
+            
+        return sum(Cn_coeffs[k] * cp_positions[k] for k in Cn_coeffs.keys()) / total_Cn_alpha  # Already in meters
+
+class EnhancedAerodynamics:
+    def __init__(self, mach, angle_attack, height, atmosphere, rocket_data, current_mass_props):
+        logging.debug("Inicializando cálculos aerodinámicos: Mach=%.2f, α=%.1f°, h=%.1fm", mach, angle_attack, height)
+        try:
+            self.mach = mach
+            self.alpha = self._validate_angle(angle_attack)
+            self.height = height
+            self.atmosphere = atmosphere
+            # rocket_data puede ser el diccionario del cohete o un EnhancedAeroGeometry ya construido
+            self.geo = rocket_data if isinstance(rocket_data, EnhancedAeroGeometry) else EnhancedAeroGeometry(rocket_data)
+            self.rocket_data = self.geo.rocket_data
+            self.mass_props = current_mass_props
+            
+            # Atmospheric properties
+            self.rho = atmosphere.give_dens(height)
+            self.temp = atmosphere.give_temp(height)
+            self.speed_of_sound = atmosphere.give_v_sonic(height)
+            self.velocity = mach * self.speed_of_sound
+            
+            # Reference parameters
+            self.ref_area = self.geo.ref_area  # [m²]
+            self.ref_diameter = self.geo.ref_diameter  # [m]
+            
+            # Calculate coefficients
+            self.cd = self._calculate_drag_coefficient()
+            self.cn_alpha = self.geo.cn_alpha  # Compartido por CL y CP
+            self.cl = self._calculate_lift_coefficient()
+            self.xcp_x = self.geo.xcp_x  # Geometry only
+            self.stability_margin = self._calculate_stability_margin()
+            
+            logging.debug("Coeficientes calculados: CD=%.3f, CL=%.3f, Stability=%.2f calibers",
+                          self.cd, self.cl, self.stability_margin)
+            
+        except Exception as e:
+            logging.error(f"Error en cálculos aerodinámicos: {str(e)}")
+            raise
+
+    def _validate_angle(self, angle):
+        """Valida y ajusta el ángulo de ataque"""
+        a_max = 10.0  # [deg]
+        return math.copysign(min(abs(angle), a_max), angle)
+
+    def _calculate_drag_coefficient(self):
+        """
+        Calculates total drag coefficient using component-based model
+
+        All components are evaluated in one pass, so the Mach terms they share
+        are computed once.
+        """
+        geo = self.geo
+        if geo.wetted_area_ratio is None:
+            return self._simple_drag_estimate()
+        
+        try:
+            m = self.mach
+            dm = m - 0.8
+            
+            # Skin friction (Prandtl-Schlichting, Reynolds number based on rocket length)
+            Re_L = (self.rho * self.velocity * geo.L_ref) / self._calculate_dynamic_viscosity()
+            Cf = 0.074 / (Re_L ** 0.2)
+            compressibility_factor = 1 / (1 + 0.12 * m * m) if m > 0.6 else 1.0
+            cd_skin_friction = Cf * self._get_surface_roughness_factor() * compressibility_factor * geo.wetted_area_ratio
+            
+            # Pressure (form) drag: nose cone with Mach correction, plus fins
+            cd_nose = geo.nose_shape_cd * (1 + 0.2 * dm) if m > 0.8 else geo.nose_shape_cd
+            cd_pressure = cd_nose * geo.nose_area_ratio + geo.fins_pressure_cd
+            
+            # Base drag (empirical)
+            cd_base = (0.12 + 0.13 * m * m if m < 0.8 else 0.25 / (1 + 0.5 * dm)) * geo.base_area_ratio
+            
+            # Interference drag at fin-body junctions (geometry only)
+            cd_interference = geo.interference_cd
+            
+            # Wave drag and transonic drag divergence correction
+            if m < 0.8:
+                cd_wave = 0.0
+                transonic_factor = 1.0
+            elif m <= 1.2:
+                # Transonic drag rise
+                x = dm / 0.4
+                cd_wave = 0.2 * dm * dm
+                transonic_factor = 1.0 + 0.5 * x * x
+            else:
+                # Supersonic wave drag
+                cd_wave = 0.4 / (m ** 1.5)
+                transonic_factor = 1.2
+            
+            # Sum all components for total drag
+            total_cd = (cd_skin_friction + cd_pressure + cd_base + cd_interference + cd_wave) * transonic_factor
+            
+            logging.debug("Drag components - Skin: %.4f, Pressure: %.4f, Base: %.4f, Interference: %.4f, Wave: %.4f",
+                          cd_skin_friction, cd_pressure, cd_base, cd_interference, cd_wave)
+            
+            return total_cd
+            
+        except Exception as e:
+            logging.error(f"Error in drag calculation: {str(e)}")
+            # Fallback to simple model
+            return self._simple_drag_estimate()
+
+    def _calculate_dynamic_viscosity(self):
+        """Calculates dynamic viscosity using Sutherland's formula"""
+        T = self.temp  # [K]
+        # Sutherland's constants for air
+        C1 = 1.458e-6  # [kg/(m·s·K^0.5)]
+        S = 110.4      # [K]
+        
+        return (C1 * T**1.5) / (T + S)
+
+    def _get_surface_roughness_factor(self):
+        """Returns surface roughness multiplier (1.0 = smooth, >1.0 = rough)"""
+        # Could be enhanced with material-specific roughness values
+        return 1.1  # Slightly rough for painted surface
+
+    def _simple_drag_estimate(self):
+        """Fallback simple drag estimation"""
+        # Basic drag coefficient estimation
+        base_cd = 0.3
+        mach_factor = 1.0 + 0.2 * abs(self.mach - 0.8) if self.mach > 0.8 else 1.0
+        alpha_factor = 1.0 + 0.1 * abs(self.alpha)
+        
+        return base_cd * mach_factor * alpha_factor
+
     def _calculate_lift_coefficient(self):
         """Calcula el coeficiente de sustentación basado en fuerza normal"""
-        Cn_coeffs = self._calculate_normal_force_coefficients()
-        Cn_alpha_total = sum(Cn_coeffs.values())
+        Cn_alpha_total = sum(self.cn_alpha.values())
         
         # Normal force coefficient
-        Cn = Cn_alpha_total * np.radians(self.alpha)
+        alpha_rad = self.alpha * deg2rad
+        Cn = Cn_alpha_total * alpha_rad
         
         # For small angles, lift ≈ normal force
-        Cl = Cn * np.cos(np.radians(self.alpha))
+        Cl = Cn * math.cos(alpha_rad)
         
         # Mach correction (Prandtl-Glauert)
+        mach2 = self.mach * self.mach
         if self.mach < 0.8:
-            Cl /= math.sqrt(1 - self.mach**2)
+            Cl /= math.sqrt(1 - mach2)
         elif self.mach > 1.2:
-            Cl /= math.sqrt(self.mach**2 - 1)
+            Cl /= math.sqrt(mach2 - 1)
         
         return Cl
 
-    def _calculate_pressure_center(self):
-        """Calcula la posición del centro de presión total"""
-        Cn_coeffs = self._calculate_normal_force_coefficients()
-        cp_positions = self._calculate_pressure_centers()
-        
-        total_Cn_alpha = sum(Cn_coeffs.values())
-        if total_Cn_alpha == 0:
-            return np.array([0., 0., 0.])
-            
-        xcp = sum(Cn_coeffs[k] * cp_positions[k] for k in Cn_coeffs.keys()) / total_Cn_alpha
-        
-        return np.array([xcp, 0, 0])  # Already in meters
+    @property
+    def xcp(self):
+        """Centro de presión como vector [x, 0, 0] en el marco del cohete [m]"""
+        return np.array([self.xcp_x, 0., 0.])
 
     def _calculate_stability_margin(self):
         """Calculates static stability margin in calibers"""
-        x_cp = self.xcp[0]  # Center of pressure [m]
+        x_cp = self.xcp_x  # Center of pressure [m]
         
         # Use current CG from mass properties (interpolate between before/after burn if needed)
         # For now, use average CG position
@@ -6,36 +6,39 @@ import numpy as np
 import math
 import logging
 
-class AerodynamicsWrapper:
-    def __init__(self, mach, angle_attack, geometry, height=0, density=1.225, temperature=288.15):
-        """
-        Robust aerodynamics wrapper with comprehensive error handling
-        """
-        self.mach = max(0.0, min(mach, 5.0))  # Clamp Mach between 0-5
-        self.alpha = self._validate_angle(angle_attack)
+deg2rad = math.pi/180  # [rad/deg]
+
+class AeroGeometry:
+    """
+    Geometry-dependent terms of the aerodynamic model.
+
+    None of these depend on Mach number or angle of attack, so they are computed
+    once per rocket and shared by every AerodynamicsWrapper built during a simulation.
+    """
+    def __init__(self, geometry):
         self.geometry = self._validate_geometry(geometry)
-        self.height = height
-        self.density = density
-        self.temperature = temperature
-        self.v_norm = self.mach * 340.0  # Approximate speed of sound for calculations
+        g = self.geometry
         
-        # Calculate coefficients with error handling
-        try:
-            self.cd = self._calculate_drag_coefficient()
-            self.cl = self._calculate_lift_coefficient()
-            self.xcp = self._calculate_pressure_center()
-        except Exception as e:
-            logging.warning(f"Aerodynamics calculation failed, using defaults: {e}")
-            self.cd = 0.5
-            self.cl = 0.0
-            self.xcp = np.array([0.5, 0, 0])
-
-    def _validate_angle(self, angle):
-        """Valida y ajusta el ángulo de ataque"""
-        a_max = 10  # [deg]
-        if abs(angle) >= a_max:
-            return a_max * (abs(angle)/angle)
-        return angle
+        # Reference area (body tube cross-section)
+        self.ref_diameter = g['diameter_bodytube'] / 1000.0
+        self.ref_area = np.pi * (self.ref_diameter/2)**2
+        
+        # Skin friction: characteristic length and wetted-to-reference area ratio
+        self.length = g['len_nosecone_rear'] / 1000.0  # [m]
+        wetted_area = np.pi * self.ref_diameter * self.length  # Simplified cylinder
+        self.wetted_area_ratio = wetted_area / self.ref_area if self.ref_area > 0 else None
+        
+        # Fins
+        self.fin_params = self._calculate_fin_parameters()
+        self.fin_drag_cd = self._calculate_fin_drag_cd()
+        self.fin_cl_alpha, self.fin_effectiveness = self._calculate_fin_lift_slope()
+        
+        # Nosecone and body tube
+        self.nosecone_shape_cd = self._calculate_nosecone_shape_drag()
+        self.body_length_factor = self._calculate_body_length_factor()
+        
+        # Center of pressure
+        self.xcp = self._calculate_pressure_center()
 
     def _validate_geometry(self, geometry):
         """Validates geometry dictionary and provides defaults for missing keys"""
@@ -70,73 +73,6 @@ class AerodynamicsWrapper:
         
         return validated_geometry
 
-    def _calculate_drag_coefficient(self):
-        """Robust drag coefficient calculation with component breakdown"""
-        try:
-            # Calculate reference area
-            ref_diameter = self.geometry['diameter_bodytube'] / 1000.0
-            ref_area = np.pi * (ref_diameter/2)**2
-            
-            if ref_area <= 0:
-                return 0.5  # Fallback
-                
-            # Calculate component drag coefficients relative to reference area
-            skin_friction = self._calculate_skin_friction()
-            pressure_drag = self._calculate_pressure_drag()
-            fin_drag = self._calculate_fin_drag()
-            base_drag = self._calculate_base_drag()
-            
-            # Sum components (they're already normalized to reference area)
-            total_cd = skin_friction + pressure_drag + fin_drag + base_drag
-            
-            # Apply corrections
-            mach_factor = self._mach_correction()
-            alpha_factor = self._alpha_correction()
-            
-            total_cd *= mach_factor * alpha_factor
-            
-            return max(0.1, min(2.0, total_cd))
-            
-        except Exception as e:
-            logging.error(f"Drag calculation error: {e}")
-            return 0.5
-
-    def _calculate_skin_friction(self):
-        """Calculate skin friction drag with proper Reynolds number"""
-        try:
-            # Characteristic length (rocket length)
-            L = self.geometry['len_nosecone_rear'] / 1000.0  # [m]
-            diameter = self.geometry['diameter_bodytube'] / 1000.0
-            
-            if L <= 0 or self.v_norm <= 0:
-                return 0.01
-                
-            # Calculate Reynolds number
-            # Dynamic viscosity of air (simplified)
-            mu = 1.789e-5  # [Pa·s] at sea level
-            Re = (self.density * self.v_norm * L) / mu
-            
-            # Turbulent skin friction coefficient (Schlichting)
-            Cf = 0.074 / (Re ** 0.2) if Re > 0 else 0.0
-            
-            # Wetted area (simplified cylinder)
-            wetted_area = np.pi * diameter * L
-            
-            # Reference area
-            ref_area = np.pi * (diameter/2)**2
-            
-            if ref_area > 0:
-                # Convert to coefficient based on reference area
-                skin_friction_cd = Cf * (wetted_area / ref_area)
-            else:
-                skin_friction_cd = 0.01
-                
-            return max(0.001, min(0.1, skin_friction_cd))
-            
-        except Exception as e:
-            logging.error(f"Skin friction calculation error: {e}")
-            return 0.01
-
     def _calculate_fin_parameters(self):
         """Calculate fin parameters based on fin type"""
         try:
@@ -196,20 +132,16 @@ class AerodynamicsWrapper:
                 'fin_type': 'Trapezoidal'
             }
 
-    def _calculate_fin_drag(self):
-        """Calculate drag contribution from fins"""
+    def _calculate_fin_drag_cd(self):
+        """Fin drag coefficient before the Mach and interference factors; None if it cannot be computed"""
         try:
-            fin_params = self._calculate_fin_parameters()
-            
-            # Reference area
-            ref_diameter = self.geometry['diameter_bodytube'] / 1000.0
-            ref_area = np.pi * (ref_diameter/2)**2
+            fin_params = self.fin_params
             
-            if ref_area <= 0:
-                return 0.02
+            if self.ref_area <= 0:
+                return None
                 
             # Fin drag relative to reference area
-            fin_drag_area_ratio = fin_params['total_fin_area'] / ref_area
+            fin_drag_area_ratio = fin_params['total_fin_area'] / self.ref_area
             
             # Base fin CD (depends on fin type and thickness)
             base_cd_fin = {
@@ -224,112 +156,27 @@ class AerodynamicsWrapper:
             ar = fin_params['aspect_ratio']
             ar_correction = 1.0 / np.sqrt(1.0 + ar)  # More realistic correction
             
-            # Mach correction for fins
-            mach_correction = self._fin_mach_correction()
-            
-            # Interference factor (fins attached to body)
-            interference_factor = 1.1
-            
-            total_fin_cd = base_cd_fin * fin_drag_area_ratio * ar_correction * mach_correction * interference_factor
-            
-            return max(0.001, min(0.1, total_fin_cd))
+            return base_cd_fin * fin_drag_area_ratio * ar_correction
             
         except Exception as e:
             logging.warning(f"Fin drag calculation issue: {e}")
-            return 0.02
-
-    def _fin_mach_correction(self):
-        """Mach correction specific to fin drag"""
-        if self.mach < 0.8:
-            return 1.0
-        elif self.mach <= 1.2:
-            return 1.0 + 0.5 * ((self.mach - 0.8) / 0.4)
-        else:
-            return 1.2
-
-    def _calculate_base_drag(self):
-        """Calculate base drag component"""
-        if self.mach < 0.8:
-            return 0.12 + 0.1 * self.mach
-        else:
-            return 0.08
-
-    def _mach_correction(self):
-        """Apply Mach number correction to drag"""
-        if self.mach < 0.8:
-            return 1.0
-        elif self.mach <= 1.0:
-            # Transonic drag rise (more accurate)
-            return 1.0 + 1.2 * ((self.mach - 0.8) / 0.2)
-        elif self.mach <= 1.2:
-            # Supersonic transition
-            return 2.2 - 0.5 * ((self.mach - 1.0) / 0.2)
-        else:
-            # Supersonic (1/Mach decay)
-            return 1.7 / (1.0 + 0.2 * self.mach)
-
-    def _alpha_correction(self):
-        """Apply angle of attack correction"""
-        alpha_rad = np.radians(abs(self.alpha))
-        return 1.0 + 0.5 * alpha_rad**2
-
-    def _calculate_lift_coefficient(self):
-        """Enhanced lift coefficient calculation"""
-        if abs(self.alpha) < 0.1:
-            return 0.0
-            
-        try:
-            alpha_rad = np.radians(self.alpha)
-            fin_params = self._calculate_fin_parameters()
-            
-            # Lift primarily comes from fins for rockets
-            # Fin lift curve slope (per radian)
-            fin_cl_alpha = (2 * np.pi * fin_params['aspect_ratio']) / (
-                2 + np.sqrt(4 + (fin_params['aspect_ratio'] * 0.95)**2 * (1 + np.tan(0)**2))
-            )
-            
-            # Number of fins effect
-            n_fins = self.geometry['N_fins']
-            fin_effectiveness = min(1.0, n_fins / 4.0)  # 4 fins is optimal
-            
-            # Total lift coefficient from fins
-            cl_fins = fin_cl_alpha * alpha_rad * fin_effectiveness
-            
-            # Body contribution (small for rockets)
-            cl_body = 0.1 * alpha_rad  # Simplified body lift
-            
-            total_cl = cl_fins + cl_body
-            
-            # Mach correction
-            if self.mach < 0.8:
-                # Subsonic Prandtl-Glauert
-                total_cl /= max(0.3, math.sqrt(1 - self.mach**2))
-            elif self.mach > 1.2:
-                # Supersonic (Ackeret theory)
-                total_cl /= math.sqrt(self.mach**2 - 1)
-                
-            return total_cl
-            
-        except Exception as e:
-            logging.error(f"Lift calculation error: {e}")
-            return 0.0
+            return None
 
-    def _calculate_pressure_drag(self):
-        """Enhanced pressure drag calculation with nosecone type consideration"""
-        try:
-            nosecone_drag = self._calculate_nosecone_drag()
-            
-            # Add body tube pressure drag (separate from base drag)
-            body_drag = self._calculate_body_pressure_drag()
-            
-            return nosecone_drag + body_drag
-            
-        except Exception as e:
-            logging.error(f"Pressure drag calculation error: {e}")
-            return 0.3
+    def _calculate_fin_lift_slope(self):
+        """Fin lift curve slope (per radian) and fin-count effectiveness"""
+        # Fin lift curve slope (per radian)
+        fin_cl_alpha = (2 * np.pi * self.fin_params['aspect_ratio']) / (
+            2 + np.sqrt(4 + (self.fin_params['aspect_ratio'] * 0.95)**2 * (1 + np.tan(0)**2))
+        )
+        
+        # Number of fins effect
+        n_fins = self.geometry['N_fins']
+        fin_effectiveness = min(1.0, n_fins / 4.0)  # 4 fins is optimal
+        
+        return fin_cl_alpha, fin_effectiveness
 
-    def _calculate_nosecone_drag(self):
-        """Calculate nosecone drag coefficient based on nosecone type"""
+    def _calculate_nosecone_shape_drag(self):
+        """Nosecone drag coefficient at Mach 0 (type and fineness ratio); None if it cannot be computed"""
         try:
             g = self.geometry
             nosecone_type = g.get('nosecone_type', 'Conical')
@@ -337,7 +184,7 @@ class AerodynamicsWrapper:
             base_diameter = g['diameter_warhead_base'] / 1000.0
             
             if base_diameter <= 0 or length <= 0:
-                return 0.1  # Fallback value
+                return None
                 
             # Fineness ratio (length to diameter ratio)
             fineness_ratio = length / base_diameter
@@ -404,67 +251,38 @@ class AerodynamicsWrapper:
             else:
                 type_factor = 1.0
                 
-            # Mach number correction for nosecone
-            mach_factor = self._nosecone_mach_correction()
-            
-            # Calculate final nosecone drag coefficient
-            cd_nose = cd_base * fineness_factor * type_factor * mach_factor
-            
-            return max(0.1, min(1.0, cd_nose))
+            return cd_base * fineness_factor * type_factor
             
         except Exception as e:
             logging.error(f"Nosecone drag calculation error: {e}")
-            return 0.4
+            return None
 
-    def _nosecone_mach_correction(self):
-        """Apply Mach number correction specific to nosecone drag"""
-        if self.mach < 0.8:
-            return 1.0
-        elif self.mach <= 1.2:
-            transonic_factor = 1.0 + 1.5 * ((self.mach - 0.8) / 0.4) ** 2
-            return transonic_factor
-        else:
-            return 1.2 / (1.0 + 0.15 * self.mach)
-
-    def _calculate_body_pressure_drag(self):
-        """Calculate pressure drag from the rocket body tube"""
+    def _calculate_body_length_factor(self):
+        """Body drag factor from the length-to-diameter ratio; None if it cannot be computed"""
         try:
             g = self.geometry
             body_length = g['len_bodytube_wo_rear'] / 1000.0
             diameter = g['diameter_bodytube'] / 1000.0
             
             if body_length <= 0 or diameter <= 0:
-                return 0.05
+                return None
                 
             # Body drag increases with length-to-diameter ratio
             l_d_ratio = body_length / diameter
             
-            # Base body drag coefficient
-            base_body_cd = 0.08
-            
             # Correction for body length
             if l_d_ratio > 20:
-                length_factor = 1.3
+                return 1.3
             elif l_d_ratio > 10:
-                length_factor = 1.1
+                return 1.1
             elif l_d_ratio > 5:
-                length_factor = 1.0
-            else:
-                length_factor = 0.9
-                
-            # Mach correction for body
-            if self.mach < 0.8:
-                mach_factor = 1.0
-            elif self.mach <= 1.2:
-                mach_factor = 1.0 + 0.5 * ((self.mach - 0.8) / 0.4)
+                return 1.0
             else:
-                mach_factor = 1.1
-                
-            return base_body_cd * length_factor * mach_factor
+                return 0.9
             
         except Exception as e:
             logging.error(f"Body pressure drag calculation error: {e}")
-            return 0.05
+            return None
 
     def _calculate_pressure_center(self):
         """Robust center of pressure calculation with nosecone consideration"""
@@ -538,4 +356,235 @@ class AerodynamicsWrapper:
             
         except Exception as e:
             logging.error(f"Nosecone CP calculation error: {e}")
-            return 0.0
\ No newline at end of file
+            return 0.0
+
+class AerodynamicsWrapper:
+    def __init__(self, mach, angle_attack, geometry, height=0, density=1.225, temperature=288.15):
+        """
+        Robust aerodynamics wrapper with comprehensive error handling
+
+        geometry can be the raw geometry dictionary or an AeroGeometry built once
+        for the rocket, which skips the geometry-only work on every call.
+        """
+        self.mach = max(0.0, min(mach, 5.0))  # Clamp Mach between 0-5
+        self.alpha = self._validate_angle(angle_attack)
+        self.aero_geometry = geometry if isinstance(geometry, AeroGeometry) else AeroGeometry(geometry)
+        self.geometry = self.aero_geometry.geometry
+        self.height = height
+        self.density = density
+        self.temperature = temperature
+        self.v_norm = self.mach * 340.0  # Approximate speed of sound for calculations
+        
+        # Calculate coefficients with error handling
+        try:
+            self.cd = self._calculate_drag_coefficient()
+            self.cl = self._calculate_lift_coefficient()
+            self.xcp = self.aero_geometry.xcp.copy()  # Geometry-only
+        except Exception as e:
+            logging.warning(f"Aerodynamics calculation failed, using defaults: {e}")
+            self.cd = 0.5
+            self.cl = 0.0
+            self.xcp = np.array([0.5, 0, 0])
+
+    def _validate_angle(self, angle):
+        """Valida y ajusta el ángulo de ataque"""
+        a_max = 10.0  # [deg]
+        return math.copysign(min(abs(angle), a_max), angle)
+
+    def _calculate_drag_coefficient(self):
+        """Robust drag coefficient calculation with component breakdown"""
+        try:
+            if self.aero_geometry.ref_area <= 0:
+                return 0.5  # Fallback
+                
+            # Calculate component drag coefficients relative to reference area
+            skin_friction = self._calculate_skin_friction()
+            pressure_drag = self._calculate_pressure_drag()
+            fin_drag = self._calculate_fin_drag()
+            base_drag = self._calculate_base_drag()
+            
+            # Sum components (they're already normalized to reference area)
+            total_cd = skin_friction + pressure_drag + fin_drag + base_drag
+            
+            # Apply corrections
+            mach_factor = self._mach_correction()
+            alpha_factor = self._alpha_correction()
+            
+            total_cd *= mach_factor * alpha_factor
+            
+            return max(0.1, min(2.0, total_cd))
+            
+        except Exception as e:
+            logging.error(f"Drag calculation error: {e}")
+            return 0.5
+
+    def _calculate_skin_friction(self):
+        """Calculate skin friction drag with proper Reynolds number"""
+        try:
+            # Characteristic length (rocket length)
+            L = self.aero_geometry.length  # [m]
+            
+            if L <= 0 or self.v_norm <= 0:
+                return 0.01
+                
+            # Calculate Reynolds number
+            # Dynamic viscosity of air (simplified)
+            mu = 1.789e-5  # [Pa·s] at sea level
+            Re = (self.density * self.v_norm * L) / mu
+            
+            # Turbulent skin friction coefficient (Schlichting)
+            Cf = 0.074 / (Re ** 0.2) if Re > 0 else 0.0
+            
+            # Wetted-to-reference area ratio (simplified cylinder)
+            wetted_area_ratio = self.aero_geometry.wetted_area_ratio
+            
+            if wetted_area_ratio is not None:
+                # Convert to coefficient based on reference area
+                skin_friction_cd = Cf * wetted_area_ratio
+            else:
+                skin_friction_cd = 0.01
+                
+            return max(0.001, min(0.1, skin_friction_cd))
+            
+        except Exception as e:
+            logging.error(f"Skin friction calculation error: {e}")
+            return 0.01
+
+    def _calculate_fin_drag(self):
+        """Calculate drag contribution from fins"""
+        fin_drag_cd = self.aero_geometry.fin_drag_cd
+        if fin_drag_cd is None:
+            return 0.02
+        
+        # Mach correction for fins
+        mach_correction = self._fin_mach_correction()
+        
+        # Interference factor (fins attached to body)
+        interference_factor = 1.1
+        
+        total_fin_cd = fin_drag_cd * mach_correction * interference_factor
+        
+        return max(0.001, min(0.1, total_fin_cd))
+
+    def _fin_mach_correction(self):
+        """Mach correction specific to fin drag"""
+        if self.mach < 0.8:
+            return 1.0
+        elif self.mach <= 1.2:
+            return 1.0 + 0.5 * ((self.mach - 0.8) / 0.4)
+        else:
+            return 1.2
+
+    def _calculate_base_drag(self):
+        """Calculate base drag component"""
+        if self.mach < 0.8:
+            return 0.12 + 0.1 * self.mach
+        else:
+            return 0.08
+
+    def _mach_correction(self):
+        """Apply Mach number correction to drag"""
+        if self.mach < 0.8:
+            return 1.0
+        elif self.mach <= 1.0:
+            # Transonic drag rise (more accurate)
+            return 1.0 + 1.2 * ((self.mach - 0.8) / 0.2)
+        elif self.mach <= 1.2:
+            # Supersonic transition
+            return 2.2 - 0.5 * ((self.mach - 1.0) / 0.2)
+        else:
+            # Supersonic (1/Mach decay)
+            return 1.7 / (1.0 + 0.2 * self.mach)
+
+    def _alpha_correction(self):
+        """Apply angle of attack correction"""
+        alpha_rad = abs(self.alpha) * deg2rad
+        return 1.0 + 0.5 * alpha_rad * alpha_rad
+
+    def _calculate_lift_coefficient(self):
+        """Enhanced lift coefficient calculation"""
+        if abs(self.alpha) < 0.1:
+            return 0.0
+            
+        try:
+            alpha_rad = self.alpha * deg2rad
+            
+            # Lift primarily comes from fins for rockets (slope and fin-count
+            # effectiveness depend only on geometry)
+            geo = self.aero_geometry
+            cl_fins = geo.fin_cl_alpha * alpha_rad * geo.fin_effectiveness
+            
+            # Body contribution (small for rockets)
+            cl_body = 0.1 * alpha_rad  # Simplified body lift
+            
+            total_cl = cl_fins + cl_body
+            
+            # Mach correction
+            mach2 = self.mach * self.mach
+            if self.mach < 0.8:
+                # Subsonic Prandtl-Glauert
+                total_cl /= max(0.3, math.sqrt(1 - mach2))
+            elif self.mach > 1.2:
+                # Supersonic (Ackeret theory)
+                total_cl /= math.sqrt(mach2 - 1)
+                
+            return total_cl
+            
+        except Exception as e:
+            logging.error(f"Lift calculation error: {e}")
+            return 0.0
+
+    def _calculate_pressure_drag(self):
+        """Enhanced pressure drag calculation with nosecone type consideration"""
+        try:
+            nosecone_drag = self._calculate_nosecone_drag()
+            
+            # Add body tube pressure drag (separate from base drag)
+            body_drag = self._calculate_body_pressure_drag()
+            
+            return nosecone_drag + body_drag
+            
+        except Exception as e:
+            logging.error(f"Pressure drag calculation error: {e}")
+            return 0.3
+
+    def _calculate_nosecone_drag(self):
+        """Calculate nosecone drag coefficient based on nosecone type"""
+        cd_shape = self.aero_geometry.nosecone_shape_cd
+        if cd_shape is None:
+            return 0.4
+        
+        # Mach number correction for nosecone
+        cd_nose = cd_shape * self._nosecone_mach_correction()
+        
+        return max(0.1, min(1.0, cd_nose))
+
+    def _nosecone_mach_correction(self):
+        """Apply Mach number correction specific to nosecone drag"""
+        if self.mach < 0.8:
+            return 1.0
+        elif self.mach <= 1.2:
+            x = (self.mach - 0.8) / 0.4
+            transonic_factor = 1.0 + 1.5 * x * x
+            return transonic_factor
+        else:
+            return 1.2 / (1.0 + 0.15 * self.mach)
+
+    def _calculate_body_pressure_drag(self):
+        """Calculate pressure drag from the rocket body tube"""
+        length_factor = self.aero_geometry.body_length_factor
+        if length_factor is None:
+            return 0.05
+        
+        # Base body drag coefficient
+        base_body_cd = 0.08
+        
+        # Mach correction for body
+        if self.mach < 0.8:
+            mach_factor = 1.0
+        elif self.mach <= 1.2:
+            mach_factor = 1.0 + 0.5 * ((self.mach - 0.8) / 0.4)
+        else:
+            mach_factor = 1.1
+            
+        return base_body_cd * length_factor * mach_factor
@@ -42,10 +42,18 @@ class Atmosphere(object):
         self.sea_level_temp=288.15                          # [K]   # Sea level temperature  given by [USSA76]
         self.temp_sensed=temp_sensed+273.15                 # [K]   # Transforms [°C] to [K]
         self.offset=self.temp_sensed -self.sea_level_temp   # [K]   # Temperature offset 
+        self.base_temp=self.sea_level_temp+self.offset      # [K]   # Ground temperature used by the lapse-rate profile
+        self.gamma_R=1.4*287.058                            # [J/(kg·K)] # Heat capacity ratio times gas constant of air
 
     @staticmethod
     @lru_cache(maxsize=128)  # Agregar caché para cálculos repetidos
     def _get_atmosphere_data(height, offset):
+        """
+        Evalúa el modelo [USSA76] una vez por (altura, offset).
+
+        give_dens y give_press se consultan a la misma altura en cada paso de la
+        simulación; con la caché ambas comparten una sola evaluación de atmos76.
+        """
         return atmos76(height, offset)
     
     def give_temp(self, height):
@@ -53,30 +61,26 @@ class Atmosphere(object):
         Calcula la temperatura atmosférica a una altura dada.
         
         Args:
-            height (float): Altura sobre el nivel del mar [m]
+            height (float o np.ndarray): Altura sobre el nivel del mar [m]
         
         Returns:
-            float: Temperatura [K]
+            float o np.ndarray: Temperatura [K]
         """
-        base_temp = self.sea_level_temp + self.offset
-        
-        if height < 11000:  # Troposfera
-            return base_temp - 0.0065 * height
-        elif height < 20000:  # Tropopausa
-            return base_temp - 0.0065 * 11000
-        else:  # Estratosfera
-            return base_temp - 0.0065 * 11000  # Temperatura constante
+        # Troposfera: gradiente de -6.5 K/km hasta 11 km; sobre ella (tropopausa y
+        # estratosfera) la temperatura se mantiene constante. np.minimum aplica las
+        # tres zonas de una vez, tanto a escalares como a arreglos de alturas.
+        return self.base_temp - 0.0065 * np.minimum(height, 11000)
 
     def give_press(self,height):
         'Gets atmospheric pressure [Pa]'
 
-        self.atmosphere=atmos76(height,self.offset) 
+        self.atmosphere=self._get_atmosphere_data(height,self.offset)
         return self.atmosphere.P
 
     def give_dens(self,height):
         'Gets density [kg/m3]'
 
-        self.atmosphere=atmos76(height,self.offset)
+        self.atmosphere=self._get_atmosphere_data(height,self.offset)
         return self.atmosphere.rho
     
     def give_v_sonic(self, height):
@@ -84,13 +88,12 @@ class Atmosphere(object):
         Calcula la velocidad del sonido a una altura dada.
         
         Args:
-            height (float): Altura sobre el nivel del mar [m]
+            height (float o np.ndarray): Altura sobre el nivel del mar [m]
         
         Returns:
-            float: Velocidad del sonido [m/s]
+            float o np.ndarray: Velocidad del sonido [m/s]
         """
-        gamma = 1.4  # Razón de calores específicos para aire
-        R = 287.058  # Constante específica del gas para aire [J/(kg·K)]
+        # γ·R del aire (γ = 1.4, R = 287.058 J/(kg·K)) se calcula una sola vez en __init__
         temp = self.give_temp(height)
         
-        return np.sqrt(gamma * R * temp)
\ No newline at end of file
+        return np.sqrt(self.gamma_R * temp)
\ No newline at end of file
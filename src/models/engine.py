@@ -258,7 +258,8 @@ class EnhancedEngine:
             
             self.ideal_thrust_coefficient = sqrt(term1 * term2 * term3)
             
-            logging.debug(f"Nozzle performance: c*={self.characteristic_velocity:.1f} m/s, Cf={self.ideal_thrust_coefficient:.2f}")
+            logging.debug("Nozzle performance: c*=%.1f m/s, Cf=%.2f",
+                          self.characteristic_velocity, self.ideal_thrust_coefficient)
             
         except Exception as e:
             logging.error(f"Nozzle performance calculation failed: {e}")
@@ -428,19 +429,18 @@ class EnhancedEngine:
     def validate_thrust_curve(self):
         """Validate that thrust curve produces correct mean thrust"""
         test_points = 200
-        total_thrust = 0
-        thrust_values = []
+        test_times = np.arange(test_points) * (self.burn_time / test_points)
+        thrust_values = np.empty(test_points)
         
-        for i in range(test_points):
-            test_time = (i / test_points) * self.burn_time
-            original_time = self.time
-            self.time = test_time
-            thrust = self._calculate_thrust_curve()
-            total_thrust += thrust
-            thrust_values.append(thrust)
+        original_time = self.time
+        try:
+            for i, test_time in enumerate(test_times):
+                self.time = test_time
+                thrust_values[i] = self._calculate_thrust_curve()
+        finally:
             self.time = original_time
         
-        calculated_mean = total_thrust / test_points
+        calculated_mean = float(thrust_values.mean())
         error = abs(calculated_mean - self.mean_thrust) / self.mean_thrust
         
         validation_result = {
@@ -448,7 +448,7 @@ class EnhancedEngine:
             'calculated_mean': calculated_mean,
             'expected_mean': self.mean_thrust,
             'error_percent': error * 100,
-            'max_thrust_used': max(thrust_values) if thrust_values else 0
+            'max_thrust_used': float(thrust_values.max())
         }
         
         if not validation_result['valid']:
@@ -482,16 +482,16 @@ class EnhancedEngine:
             return {"available": False}
         
         try:
-            # Sample the thrust curve to get statistics
+            # Sample the thrust curve to get statistics (interp1d evaluates the whole array at once)
             sample_times = np.linspace(0, self.burn_time, 100)
-            thrust_samples = [self._calculate_experimental_thrust(t) for t in sample_times]
+            thrust_samples = np.maximum(self.thrust_interpolator(sample_times), 0.0)
             
             return {
                 "available": True,
                 "data_points": len(self.thrust_interpolator.x) if hasattr(self.thrust_interpolator, 'x') else 0,
                 "burn_time": self.burn_time,
-                "max_thrust": max(thrust_samples),
-                "total_impulse": np.trapezoid(thrust_samples, sample_times),
+                "max_thrust": float(thrust_samples.max()),
+                "total_impulse": float(np.trapezoid(thrust_samples, sample_times)),
                 "source": self.thrust_curve_file or "provided_data"
             }
         except Exception as e:
@@ -514,7 +514,10 @@ class EnhancedEngine:
         if ambient_pressure is not None:
             if ambient_pressure < 0:
                 raise ValueError("Ambient pressure cannot be negative")
-            self.ambient_pressure = ambient_pressure
+            if ambient_pressure != self.ambient_pressure:
+                self.ambient_pressure = ambient_pressure
+                # Ideal thrust coefficient depends on ambient pressure
+                self._calculate_nozzle_performance()
         
         self._calculate_performance()
 
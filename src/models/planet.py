@@ -12,7 +12,7 @@ Module that updates Greenwich Mean Sidereal Time from simulation time
 External dependencies:
 
 Internal dependencies:
-cmath       -cMath Python extension. https://docs.python.org/3/library/cmath.html
+math        -Math Python extension. https://docs.python.org/3/library/math.html
 
 Changelog:
 Date          Name              Change
@@ -26,7 +26,7 @@ ___ _       _________ _                 ___ _
 
 """
 # Imports
-from cmath import pi
+from math import pi
 
 # Define Planet class for Planet module
 class Planet(object):
@@ -38,12 +38,11 @@ Ecuaciones Principales:
 # Imports
 import numpy as np
 import navpy as nav
-from cmath import pi
 import json
 import streamlit as st
 import logging
 from src.models.engine import EnhancedEngine
-from src.models.aerodynamics_wrapper import AerodynamicsWrapper
+from src.models.aerodynamics_wrapper import AerodynamicsWrapper, AeroGeometry
 from src.utils.mattools import MatTools as Mat
 from src.utils.geotools import GeoTools as Geo
 
@@ -148,6 +147,12 @@ class Rocket(object):
 
         self.parachute = None
         self.has_parachute = False
+
+        # Motor reutilizado entre pasos; se reconstruye solo si cambia su configuración
+        self._engine = None
+        self._engine_data = None
+        self._rocket_settings = {}  # Configuraciones JSON ya leídas, por nombre de cohete
+        self._aero_geometry = {}    # Invariantes geométricos de la aerodinámica, por nombre de cohete
         
         # Historial para paracaídas
         self.hist_parachute_state = []
@@ -377,6 +382,38 @@ class Rocket(object):
         self.press_amb=press_amb  # [Pa]      # Atmospheric pressure
         self.v_sonic=v_sonic      # [m/s]     # Speed of sound 
 
+    def _load_rocket_settings(self, rocket_name):
+        """
+        Lee la configuración JSON del cohete una sola vez por simulación.
+
+        update_aerodynamics y update_engine se llaman en cada paso de integración;
+        la configuración no cambia durante la simulación, así que se guarda en memoria.
+        """
+        if rocket_name not in self._rocket_settings:
+            with open('data/rockets/configs/' + rocket_name + '.json', 'r') as file:
+                self._rocket_settings[rocket_name] = json.load(file)
+        return self._rocket_settings[rocket_name]
+
+    def _aerodynamics_geometry(self, rocket_settings):
+        """Diccionario de geometría que usa el modelo aerodinámico, a partir de la configuración del cohete"""
+        return {
+            'len_warhead': rocket_settings['nosecone']['length'],
+            'diameter_warhead_base': rocket_settings['nosecone']['diameter'],
+            'len_nosecone_fins': rocket_settings['geometry']['length nosecone fins'],
+            'len_nosecone_rear': rocket_settings['geometry']['total length'],
+            'len_bodytube_wo_rear': rocket_settings['fuselage']['length'],
+            'diameter_bodytube': rocket_settings['fuselage']['diameter'],
+            'len_rear': rocket_settings['rear_section']['length'],
+            'end_diam_rear': rocket_settings['rear_section']['diameter'],
+            'diameter_rear_bodytube': rocket_settings['rear_section']['diameter'],
+            'diameter_bodytube_fins': rocket_settings['fuselage']['diameter'],
+            'fins_chord_root': rocket_settings['fins']['chord_root'],
+            'fins_chord_tip': rocket_settings['fins']['chord_tip'],
+            'fins_mid_chord': rocket_settings['fins']['mid_chord'],
+            'fins_span': rocket_settings['fins']['span'],
+            'N_fins': rocket_settings['fins']['N_fins']
+        }
+
     def update_aerodynamics(self, rocket_name):
         """
         Actualiza las características aerodinámicas del cohete.
@@ -386,33 +423,19 @@ class Rocket(object):
 
         try:
             # Cargar configuración del cohete
-            with open('data/rockets/configs/' + rocket_name + '.json', 'r') as file:
-                rocket_settings = json.load(file)
-
-            # Crear diccionario de geometría
-            geometry = {
-                'len_warhead': rocket_settings['nosecone']['length'],
-                'diameter_warhead_base': rocket_settings['nosecone']['diameter'],
-                'len_nosecone_fins': rocket_settings['geometry']['length nosecone fins'],
-                'len_nosecone_rear': rocket_settings['geometry']['total length'],
-                'len_bodytube_wo_rear': rocket_settings['fuselage']['length'],
-                'diameter_bodytube': rocket_settings['fuselage']['diameter'],
-                'len_rear': rocket_settings['rear_section']['length'],
-                'end_diam_rear': rocket_settings['rear_section']['diameter'],
-                'diameter_rear_bodytube': rocket_settings['rear_section']['diameter'],
-                'diameter_bodytube_fins': rocket_settings['fuselage']['diameter'],
-                'fins_chord_root': rocket_settings['fins']['chord_root'],
-                'fins_chord_tip': rocket_settings['fins']['chord_tip'],
-                'fins_mid_chord': rocket_settings['fins']['mid_chord'],
-                'fins_span': rocket_settings['fins']['span'],
-                'N_fins': rocket_settings['fins']['N_fins']
-            }
+            rocket_settings = self._load_rocket_settings(rocket_name)
+
+            # Geometría aerodinámica (constante durante la simulación, se prepara una vez)
+            aero_geometry = self._aero_geometry.get(rocket_name)
+            if aero_geometry is None:
+                aero_geometry = AeroGeometry(self._aerodynamics_geometry(rocket_settings))
+                self._aero_geometry[rocket_name] = aero_geometry
 
             # Crear instancia de aerodinámica
             aero = AerodynamicsWrapper(
                 mach=self.mach,
                 angle_attack=self.alpha,
-                geometry=geometry,
+                geometry=aero_geometry,
                 height=self.r_enu[2],
                 density=self.density
             )
@@ -432,8 +455,7 @@ class Rocket(object):
     def update_engine(self, rocket_name):
         """Enhanced engine update with thrust curve validation"""
         try:
-            with open('data/rockets/configs/' + rocket_name + '.json', 'r') as file:
-                rocket_settings = json.load(file)
+            rocket_settings = self._load_rocket_settings(rocket_name)
 
             engine_data = rocket_settings['engine']
             
@@ -443,21 +465,15 @@ class Rocket(object):
                 thrust_curve_file = engine_data.get('thrust_curve_file')
                 logging.info(f"Using experimental thrust curve: {thrust_curve_file}")
             
-            # Create enhanced engine with validation
-            Eng = EnhancedEngine(
-                time=self.time,
-                burn_time=engine_data["burn_time"],
-                ambient_pressure=self.press_amb,
-                nozzle_exit_diameter=engine_data["nozzle_exit_diameter"],
-                propellant_mass=engine_data["propellant_mass"],
-                specific_impulse=engine_data["specific_impulse"],
-                mean_thrust=engine_data["mean_thrust"],
-                max_thrust=engine_data["max_thrust"],
-                mean_chamber_pressure=engine_data["mean_chamber_pressure"],
-                max_chamber_pressure=engine_data["max_chamber_pressure"],
-                thrust_to_weight_ratio=engine_data["thrust_to_weight_ratio"],
-                thrust_curve_file=thrust_curve_file  # Pass the thrust curve file if experimental
-            )
+            # Create enhanced engine with validation (only when its configuration changes;
+            # otherwise the existing instance is advanced to the current time and pressure)
+            if self._engine is not None and self._engine_data == engine_data:
+                Eng = self._engine
+                Eng.update(time=self.time, ambient_pressure=self.press_amb)
+            else:
+                Eng = self._build_engine(engine_data, thrust_curve_file)
+                self._engine = Eng
+                self._engine_data = engine_data
             
             # Validate thrust curve on first call
             if not hasattr(self, '_thrust_curve_validated'):
@@ -502,6 +518,23 @@ class Rocket(object):
             logging.error(f"Engine update error: {str(e)}")
             self._set_engine_fallback_values()
 
+    def _build_engine(self, engine_data, thrust_curve_file):
+        """Crea el motor a partir de la sección 'engine' de la configuración del cohete"""
+        return EnhancedEngine(
+            time=self.time,
+            burn_time=engine_data["burn_time"],
+            ambient_pressure=self.press_amb,
+            nozzle_exit_diameter=engine_data["nozzle_exit_diameter"],
+            propellant_mass=engine_data["propellant_mass"],
+            specific_impulse=engine_data["specific_impulse"],
+            mean_thrust=engine_data["mean_thrust"],
+            max_thrust=engine_data["max_thrust"],
+            mean_chamber_pressure=engine_data["mean_chamber_pressure"],
+            max_chamber_pressure=engine_data["max_chamber_pressure"],
+            thrust_to_weight_ratio=engine_data["thrust_to_weight_ratio"],
+            thrust_curve_file=thrust_curve_file  # Pass the thrust curve file if experimental
+        )
+
     def _set_engine_fallback_values(self):
         """Set fallback values when engine calculation fails"""
         self.mass_flux = 0.0
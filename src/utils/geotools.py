@@ -15,7 +15,7 @@ numpy       -Numpy Python extension. http://numpy.org/
 MatTools    -Self-written python module containing mathematical functions
 
 Internal dependencies:
-cmath       -cMath Python extension. https://docs.python.org/3/library/cmath.html
+math        -Math Python extension. https://docs.python.org/3/library/math.html
 
 Changelog:
 Date          Name              Change
@@ -40,7 +40,7 @@ ___ _       ____________ _                  ___ _
 # Imports
 import numpy as np
 from src.utils.mattools import MatTools as Mat
-from cmath import pi
+from math import pi
 
 class GeoTools:
     """Clase de utilidades para conversiones geométricas y transformaciones de coordenadas."""
@@ -245,4 +245,37 @@ class GeoTools:
         sin_lat = np.sin(lat_rad)
         
         N = GeoTools.a / np.sqrt(1 - GeoTools.e2 * sin_lat**2)
-        return N
\ No newline at end of file
+        return N
+
+    @staticmethod
+    def simplify_path(points, epsilon):
+        """Índices de los vértices que conserva Ramer-Douglas-Peucker con tolerancia `epsilon`"""
+        points = np.asarray(points, dtype=float)
+        n = len(points)
+        if n < 3:
+            return np.arange(n)
+
+        keep = np.zeros(n, dtype=bool)
+        keep[0] = keep[-1] = True
+        stack = [(0, n - 1)]
+        while stack:
+            start, end = stack.pop()
+            if end - start < 2:
+                continue
+
+            # Distancia de los puntos intermedios a la recta start-end
+            segment = points[end] - points[start]
+            rel = points[start + 1:end] - points[start]
+            seg_len2 = segment @ segment
+            if seg_len2 > 0:
+                rel = rel - np.outer(rel @ segment / seg_len2, segment)
+            dist2 = np.einsum('ij,ij->i', rel, rel)
+
+            k = np.argmax(dist2)
+            if dist2[k] > epsilon * epsilon:
+                mid = start + 1 + k
+                keep[mid] = True
+                stack.append((start, mid))
+                stack.append((mid, end))
+
+        return np.flatnonzero(keep)
@@ -0,0 +1,73 @@
+"""Static stability margin (CM/CP distance in calibers) per simulation sample, used by the dashboard."""
+
+import numpy as np
+import pandas as pd
+
+STABILITY_THRESHOLDS = (2.0, 1.5, 1.0)  # [calibers] Very Stable / Stable / Marginally Stable
+STABILITY_STATUS = ("Very Stable", "Stable", "Marginally Stable")
+STABILITY_COLORS = ("green", "blue", "orange")
+
+def stability_metrics(data, cm_cols, cp_cols, rocket_diameter=0.103):
+    """Métricas de estabilidad por muestra, con el mismo índice que `data`.
+
+    Se conservan todas las filas: un CM/CP no finito produce NaN (estado "Unstable"),
+    de modo que las columnas quedan alineadas con `data` al exportarlas.
+    """
+    cm_b = data[cm_cols].to_numpy(dtype=float)
+    cp_b = data[cp_cols].to_numpy(dtype=float)
+
+    # Distance between CM and CP
+    cm_cp = cp_b - cm_b
+    cm_cp_distance = np.sqrt(np.einsum('ij,ij->i', cm_cp, cm_cp))
+
+    # Stability margin in calibers (rocket diameters)
+    stability_calibers = cm_cp_distance / rocket_diameter
+
+    # Stability status (NaN compares False and falls through to "Unstable")
+    thresholds = [stability_calibers > limit for limit in STABILITY_THRESHOLDS]
+    status = np.select(thresholds, STABILITY_STATUS, default="Unstable")
+    color = np.select(thresholds, STABILITY_COLORS, default="red")
+
+    return pd.DataFrame({
+        'time': data['Simulation time'].to_numpy(),
+        'cm_cp_distance': cm_cp_distance,
+        'stability_calibers': stability_calibers,
+        'status': status,
+        'color': color,
+        'cm_x': cm_b[:, 0],
+        'cp_x': cp_b[:, 0]
+    }, index=data.index)
+
+def summarize_stability(calibers, status):
+    """Mínimo, máximo, media y valor final del margen de estabilidad, ignorando muestras NaN"""
+    calibers = np.asarray(calibers, dtype=float)
+    if not np.isfinite(calibers).any():
+        return {}
+    i_min, i_max = int(np.nanargmin(calibers)), int(np.nanargmax(calibers))
+    return {
+        'min': float(calibers[i_min]),
+        'max': float(calibers[i_max]),
+        'mean': float(np.nanmean(calibers)),
+        'final': float(calibers[-1]),
+        'min_status': str(status[i_min]),
+        'max_status': str(status[i_max]),
+        'final_status': str(status[-1])
+    }
+
+def add_stability_columns(data, stability_df):
+    """Copia de `data` con las columnas de estabilidad, alineadas por índice.
+
+    Lanza ValueError si `stability_df` no se calculó sobre las mismas muestras que `data`
+    (p. ej. un parquet reescrito entre ambas lecturas), en lugar de desalinear filas en silencio.
+    """
+    if len(stability_df) != len(data) or not stability_df.index.equals(data.index):
+        raise ValueError(f"Stability data ({len(stability_df)} rows) does not match simulation data ({len(data)} rows)")
+    # El tiempo de stability_df puede venir en float32 (datos de gráficos); se compara con tolerancia
+    if not np.allclose(stability_df['time'].to_numpy(dtype=float), data['Simulation time'].to_numpy(dtype=float),
+                       rtol=1e-6, equal_nan=True):
+        raise ValueError("Stability data time does not match 'Simulation time'")
+    export_data = data.copy()
+    export_data['stability_calibers'] = stability_df['stability_calibers']
+    export_data['stability_status'] = stability_df['status']
+    export_data['cm_cp_distance'] = stability_df['cm_cp_distance']
+    return export_data
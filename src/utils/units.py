@@ -2,6 +2,7 @@
 functions for performing conversion."""
 
 import collections
+import functools
 
 # The keys in this dictionary specify the units that all calculations are done in internally
 unitLabels = {
@@ -146,13 +147,18 @@ def getConversion(originUnit, destUnit, _visited=None):
                 continue
     raise KeyError(f"Cannot find conversion from <{originUnit}> to <{destUnit}>")
 
+@functools.lru_cache(maxsize=None)
+def getCachedConversion(originUnit, destUnit):
+    """Same as getConversion, but each (originUnit, destUnit) ratio is only searched for once."""
+    return getConversion(originUnit, destUnit)
+
 def convert(quantity, originUnit, destUnit):
     """Returns the value of 'quantity' when it is converted from 'originUnit' to 'destUnit'."""
-    return quantity * getConversion(originUnit, destUnit)
+    return quantity * getCachedConversion(originUnit, destUnit)
 
 def convertAll(quantities, originUnit, destUnit):
     """Converts a list of values from 'originUnit' to 'destUnit'."""
-    convRate = getConversion(originUnit, destUnit)
+    convRate = getCachedConversion(originUnit, destUnit)
     return [q * convRate for q in quantities]
 
 def convFormat(quantity, originUnit, destUnit, places=3):
@@ -82,5 +82,20 @@ class TestAtmosphere(unittest.TestCase):
             self.assertAlmostEqual(v_sonic, expected_v_sonic, delta=tolerance,
                 msg=f"Para altura {height}m: velocidad calculada {v_sonic} != esperada {expected_v_sonic}")
 
+    def test_vectorized_profile(self):
+        """Prueba que temperatura y velocidad del sonido acepten arreglos de alturas"""
+        heights = np.array([0.0, 5000.0, 11000.0, 15000.0, 25000.0])  # [m]
+
+        temps = self.atmosphere.give_temp(heights)
+        v_sonic = self.atmosphere.give_v_sonic(heights)
+
+        self.assertEqual(temps.shape, heights.shape)
+        for i, height in enumerate(heights):
+            self.assertAlmostEqual(temps[i], self.atmosphere.give_temp(float(height)), places=self.precision)
+            self.assertAlmostEqual(v_sonic[i], self.atmosphere.give_v_sonic(float(height)), places=self.precision)
+
+        # Sobre la tropopausa la temperatura es constante
+        self.assertAlmostEqual(temps[2], temps[4], places=self.precision)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
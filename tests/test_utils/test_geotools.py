@@ -85,5 +85,19 @@ class TestGeoTools(unittest.TestCase):
             self.assertGreaterEqual(coord_back[1], -180.0)
             self.assertLessEqual(coord_back[1], 180.0)
 
+    def test_simplify_path(self):
+        """Prueba la simplificación Ramer-Douglas-Peucker de una trayectoria"""
+        # Tramo recto: solo se conservan los extremos
+        line = np.column_stack((np.linspace(0, 100, 50), np.zeros(50), np.linspace(0, 10, 50)))
+        np.testing.assert_array_equal(Geo.simplify_path(line, 0.1), [0, 49])
+
+        # Ascenso y descenso: el apogeo se conserva
+        up = np.linspace(0, 1000, 51)
+        path = np.column_stack((np.linspace(0, 200, 101), np.zeros(101), np.concatenate((up, up[-2::-1]))))
+        np.testing.assert_array_equal(Geo.simplify_path(path, 1.0), [0, 50, 100])
+
+        # Trayectorias de menos de tres puntos no se modifican
+        np.testing.assert_array_equal(Geo.simplify_path(line[:2], 1.0), [0, 1])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,67 @@
+import unittest
+import numpy as np
+import pandas as pd
+from src.utils.stability import stability_metrics, summarize_stability, add_stability_columns
+
+CM_COLS = ["cm_bx", "cm_by", "cm_bz"]
+CP_COLS = ["cp_bx", "cp_by", "cp_bz"]
+
+class TestStability(unittest.TestCase):
+    def setUp(self):
+        """Configuración inicial: cinco muestras, la segunda con CM no finito"""
+        self.diameter = 0.103  # [m]
+        self.data = pd.DataFrame({
+            "Simulation time": [0.0, 0.1, 0.2, 0.3, 0.4],
+            "cm_bx": [1.0, np.nan, 1.0, 1.0, 1.0],
+            "cm_by": [0.0, 0.0, 0.0, 0.0, 0.0],
+            "cm_bz": [0.0, 0.0, 0.0, 0.0, 0.0],
+            "cp_bx": [1.3, 1.3, 1.18, 1.12, 1.05],
+            "cp_by": [0.0, 0.0, 0.0, 0.0, 0.0],
+            "cp_bz": [0.0, 0.0, 0.0, 0.0, 0.0],
+        })
+
+    def test_nan_sample_keeps_rows(self):
+        """Prueba que una muestra NaN no elimina filas ni desplaza el índice"""
+        stability_df = stability_metrics(self.data, CM_COLS, CP_COLS, self.diameter)
+
+        self.assertEqual(len(stability_df), len(self.data))
+        self.assertTrue(stability_df.index.equals(self.data.index))
+        self.assertTrue(np.isnan(stability_df["stability_calibers"].iloc[1]))
+        self.assertEqual(stability_df["status"].iloc[1], "Unstable")
+
+    def test_export_columns_aligned_with_time(self):
+        """Prueba que las columnas de estabilidad exportadas coinciden con 'Simulation time'"""
+        stability_df = stability_metrics(self.data, CM_COLS, CP_COLS, self.diameter)
+        export_data = add_stability_columns(self.data, stability_df)
+
+        expected = np.abs(self.data["cp_bx"] - self.data["cm_bx"]) / self.diameter
+        np.testing.assert_array_almost_equal(export_data["stability_calibers"], expected)
+        np.testing.assert_array_equal(export_data["Simulation time"], stability_df["time"])
+        self.assertFalse(export_data["stability_calibers"].drop(index=1).isna().any())
+
+    def test_export_rejects_mismatched_rows(self):
+        """Prueba que la exportación rechaza métricas calculadas sobre otras muestras"""
+        stability_df = stability_metrics(self.data, CM_COLS, CP_COLS, self.diameter)
+
+        with self.assertRaises(ValueError):
+            add_stability_columns(self.data, stability_df.iloc[:-1])
+        with self.assertRaises(ValueError):
+            add_stability_columns(self.data, stability_df.reset_index(drop=True).iloc[::-1])
+        shifted = stability_df.assign(time=stability_df["time"] + 1.0)
+        with self.assertRaises(ValueError):
+            add_stability_columns(self.data, shifted)
+
+    def test_summary_ignores_nan(self):
+        """Prueba que el resumen ignora las muestras NaN"""
+        stability_df = stability_metrics(self.data, CM_COLS, CP_COLS, self.diameter)
+        stats = summarize_stability(stability_df["stability_calibers"].to_numpy(), stability_df["status"].to_numpy())
+
+        finite = stability_df["stability_calibers"].dropna()
+        self.assertAlmostEqual(stats["min"], finite.min())
+        self.assertAlmostEqual(stats["max"], finite.max())
+        self.assertAlmostEqual(stats["mean"], finite.mean())
+        self.assertEqual(stats["min_status"], "Unstable")
+        self.assertEqual(stats["max_status"], "Very Stable")
+
+if __name__ == '__main__':
+    unittest.main()